@@ -33,16 +33,24 @@ __version__ = "0.1.0"
 __author__ = "Arboric"
 __license__ = "MIT"
 
-from arboric.core.autopilot import Autopilot, OptimizationConfig, create_autopilot
-from arboric.core.grid_oracle import MockGrid, get_grid
-from arboric.core.models import (
-    FleetOptimizationResult,
-    GridWindow,
-    ScheduleResult,
-    Workload,
-    WorkloadPriority,
-    WorkloadType,
-)
+import importlib
+from typing import Any
+
+# Exports resolve on first access so that importing a submodule (e.g. the
+# CLI entry point) does not pull in pandas and the optimizer up front.
+_LAZY_EXPORTS = {
+    "Autopilot": "arboric.core.autopilot",
+    "OptimizationConfig": "arboric.core.autopilot",
+    "create_autopilot": "arboric.core.autopilot",
+    "MockGrid": "arboric.core.grid_oracle",
+    "get_grid": "arboric.core.grid_oracle",
+    "FleetOptimizationResult": "arboric.core.models",
+    "GridWindow": "arboric.core.models",
+    "ScheduleResult": "arboric.core.models",
+    "Workload": "arboric.core.models",
+    "WorkloadPriority": "arboric.core.models",
+    "WorkloadType": "arboric.core.models",
+}
 
 __all__ = [
     # Models
@@ -60,3 +68,16 @@ __all__ = [
     "OptimizationConfig",
     "create_autopilot",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    """Import a public export on first access."""
+    if name not in _LAZY_EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(_LAZY_EXPORTS[name]), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted([*globals(), *_LAZY_EXPORTS])
@@ -0,0 +1,251 @@
+"""
+In-process forecast cache for API routes.
+
+MockGrid forecasts are a pure function of region, instance profile, seed,
+horizon and start hour, so requests landing in the same hour can reuse the
+already-generated forecast instead of rebuilding it window by window.
+Live grids are never cached.
+
+Routes only read forecasts through this module, which never advances a
+shared grid's RNG, so MockGrid instances themselves are shared as well.
+"""
+
+from datetime import datetime
+from datetime import timezone as tz
+from functools import lru_cache
+
+import pandas as pd
+
+from arboric.core.config import ArboricConfig
+from arboric.core.grid_oracle import (
+    REGION_PROFILES,
+    MockGrid,
+    daily_seed,
+    get_grid,
+    uses_live_grid,
+)
+
+
+@lru_cache(maxsize=64)
+def _shared_mock_grid(
+    region: str, instance_type: str | None, cloud_provider: str | None, seed: int
+) -> MockGrid:
+    """Build a MockGrid once per region, instance profile and seed."""
+    return MockGrid(
+        region=region, instance_type=instance_type, cloud_provider=cloud_provider, seed=seed
+    )
+
+
+def get_shared_grid(
+    region: str,
+    config: ArboricConfig,
+    instance_type: str | None = None,
+    cloud_provider: str | None = None,
+) -> MockGrid:
+    """
+    Get a grid provider for an API request.
+
+    Same as get_grid, except that simulated grids are shared across requests
+    for the day instead of being constructed per request. Only pass the
+    result to get_forecast / get_forecast_records.
+
+    Args:
+        region: Grid region identifier
+        config: ArboricConfig instance
+        instance_type: Cloud instance type (use with cloud_provider)
+        cloud_provider: Cloud provider (use with instance_type)
+
+    Returns:
+        Grid provider instance (LiveGrid or shared MockGrid)
+
+    Raises:
+        ValueError: If the region is unknown
+    """
+    if uses_live_grid(config):
+        return get_grid(
+            region=region,
+            config=config,
+            instance_type=instance_type,
+            cloud_provider=cloud_provider,
+        )
+    return _shared_mock_grid(region.lower(), instance_type, cloud_provider, daily_seed())
+
+
+def forecast_start_time(grid: MockGrid) -> datetime:
+    """
+    Get the hour-aligned forecast start time for a grid.
+
+    MockGrid expects naive local time for correct hour_of_day calculations,
+    while LiveGrid interprets naive datetimes as UTC.
+
+    Args:
+        grid: Grid provider instance (MockGrid or LiveGrid)
+
+    Returns:
+        Naive datetime aligned to the current hour
+    """
+    now_local = datetime.now().replace(minute=0, second=0, microsecond=0)
+    if getattr(grid, "is_live", False):
+        return now_local.astimezone(tz.utc).replace(tzinfo=None)
+    return now_local
+
+
+def _is_cacheable(grid: MockGrid) -> bool:
+    """Only seeded MockGrid instances produce reproducible forecasts."""
+    return isinstance(grid, MockGrid) and grid.seed is not None
+
+
+def forecast_to_records(forecast_df: pd.DataFrame) -> list[dict]:
+    """
+    Convert a forecast DataFrame to a list of row dicts.
+
+    Equivalent to ``forecast_df.reset_index().to_dict(orient="records")`` but
+    pulls each column out as a Python list once and zips rows together,
+    instead of boxing every cell through pandas.
+
+    Args:
+        forecast_df: Forecast DataFrame with a timestamp index
+
+    Returns:
+        List of row dicts, index first, then columns in order
+    """
+    keys = [forecast_df.index.name or "index", *forecast_df.columns]
+    index_values = (
+        forecast_df.index.to_pydatetime().tolist()
+        if isinstance(forecast_df.index, pd.DatetimeIndex)
+        else forecast_df.index.tolist()
+    )
+    columns = [forecast_df[column].tolist() for column in forecast_df.columns]
+    return [dict(zip(keys, row)) for row in zip(index_values, *columns)]
+
+
+@lru_cache(maxsize=64)
+def _cached_mock_forecast(
+    region: str,
+    hours: int,
+    start_time: datetime,
+    instance_type: str | None,
+    cloud_provider: str | None,
+    seed: int,
+) -> pd.DataFrame:
+    """Generate a MockGrid forecast from a freshly seeded grid."""
+    grid = MockGrid(
+        region=region,
+        instance_type=instance_type,
+        cloud_provider=cloud_provider,
+        seed=seed,
+    )
+    return grid.get_forecast(hours=hours, start_time=start_time)
+
+
+@lru_cache(maxsize=64)
+def _cached_mock_forecast_records(
+    region: str,
+    hours: int,
+    start_time: datetime,
+    instance_type: str | None,
+    cloud_provider: str | None,
+    seed: int,
+) -> list[dict]:
+    """Serialize a cached MockGrid forecast to a list of row dicts."""
+    forecast_df = _cached_mock_forecast(
+        region, hours, start_time, instance_type, cloud_provider, seed
+    )
+    return forecast_to_records(forecast_df)
+
+
+def _cache_key(grid: MockGrid, hours: int, start_time: datetime) -> tuple:
+    return (grid.region, hours, start_time, grid.instance_type, grid.cloud_provider, grid.seed)
+
+
+def forecast_cache_key(grid: MockGrid, hours: int) -> tuple | None:
+    """
+    Get the values that fully determine the grid's current forecast.
+
+    Args:
+        grid: Grid provider instance (MockGrid or LiveGrid)
+        hours: Forecast horizon in hours
+
+    Returns:
+        Hashable key for reproducible (seeded MockGrid) forecasts, else None
+    """
+    if not _is_cacheable(grid):
+        return None
+    return _cache_key(grid, hours, forecast_start_time(grid))
+
+
+def get_forecast_for_key(cache_key: tuple) -> pd.DataFrame:
+    """
+    Get the cached forecast identified by a forecast_cache_key() result.
+
+    Args:
+        cache_key: Key returned by forecast_cache_key()
+
+    Returns:
+        Forecast DataFrame (a private copy callers may modify)
+    """
+    forecast_df: pd.DataFrame = _cached_mock_forecast(*cache_key).copy()
+    return forecast_df
+
+
+def get_forecast(grid: MockGrid, hours: int) -> pd.DataFrame:
+    """
+    Get a forecast starting at the current hour, cached for MockGrid.
+
+    Args:
+        grid: Grid provider instance (MockGrid or LiveGrid)
+        hours: Forecast horizon in hours
+
+    Returns:
+        Forecast DataFrame (a private copy callers may modify)
+    """
+    start_time = forecast_start_time(grid)
+    if not _is_cacheable(grid):
+        return grid.get_forecast(hours=hours, start_time=start_time)
+    forecast_df: pd.DataFrame = _cached_mock_forecast(*_cache_key(grid, hours, start_time)).copy()
+    return forecast_df
+
+
+def get_forecast_records(grid: MockGrid, hours: int) -> list[dict]:
+    """
+    Get a forecast as a list of row dicts, cached for MockGrid.
+
+    Args:
+        grid: Grid provider instance (MockGrid or LiveGrid)
+        hours: Forecast horizon in hours
+
+    Returns:
+        List of row dicts with timestamp and forecast columns (shared; do not modify)
+    """
+    start_time = forecast_start_time(grid)
+    if not _is_cacheable(grid):
+        forecast_df = grid.get_forecast(hours=hours, start_time=start_time)
+        return forecast_to_records(forecast_df)
+    return _cached_mock_forecast_records(*_cache_key(grid, hours, start_time))
+
+
+def warm_forecast_cache(config: ArboricConfig, hours: tuple[int, ...] = (24, 48)) -> None:
+    """
+    Pre-build the shared grid and forecasts for every simulated region.
+
+    The default horizons match /forecast (24h) and /optimize and /fleet
+    (48h), so the first request of the hour hits a warm cache. Live grids
+    are skipped; warming them would spend API quota at startup.
+
+    Args:
+        config: ArboricConfig instance
+        hours: Forecast horizons to pre-generate
+    """
+    if uses_live_grid(config):
+        return
+    for region in REGION_PROFILES:
+        grid = get_shared_grid(region, config)
+        for horizon in hours:
+            get_forecast_records(grid, horizon)
+
+
+def clear_forecast_cache() -> None:
+    """Drop all cached grids and forecasts (mainly for testing)."""
+    _shared_mock_grid.cache_clear()
+    _cached_mock_forecast.cache_clear()
+    _cached_mock_forecast_records.cache_clear()
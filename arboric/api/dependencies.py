@@ -38,4 +38,5 @@ def get_autopilot(config: ArboricConfig = Depends(get_arboric_config)) -> Autopi
         min_delay_hours=config.optimization.min_delay_hours,
         prefer_continuous=config.optimization.prefer_continuous,
     )
-    return Autopilot(config=opt_config)
+    # API responses never include the optimization log
+    return Autopilot(config=opt_config, enable_log=False)
@@ -5,18 +5,63 @@ FastAPI application providing HTTP endpoints for workload optimization.
 """
 
 import logging
+import os
 from datetime import datetime
+from typing import Any
 
 from fastapi import FastAPI, Request
 from fastapi.exceptions import RequestValidationError
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.middleware.gzip import GZipMiddleware
 from pydantic import ValidationError
 
+from arboric.api.cache import warm_forecast_cache
+from arboric.api.dependencies import get_arboric_config
 from arboric.api.routes import config, fleet, forecast, history, optimize, receipt, status
+from arboric.api.utils import ORJSONResponse
+from arboric.core._kernels import warm_up as warm_up_kernels
 
 logger = logging.getLogger(__name__)
 
+# Error response shape per exception type: (status code, error name,
+# fixed message or None to use str(exc), include field-level details).
+# Lookup follows the exception's MRO, so pydantic's ValidationError (a
+# ValueError subclass) keeps its own entry.
+_ERROR_RESPONSES: dict[type[Exception], tuple[int, str, str | None, bool]] = {
+    RequestValidationError: (422, "ValidationError", "Request validation failed", True),
+    ValidationError: (422, "ValidationError", "Request validation failed", True),
+    ValueError: (400, "ValueError", None, False),
+    Exception: (500, "InternalServerError", "An unexpected error occurred", False),
+}
+
+
+async def error_handler(request: Request, exc: Exception) -> ORJSONResponse:
+    """
+    Convert exceptions into structured JSON error responses.
+
+    Validation errors (FastAPI and Pydantic) return 422 with field-level
+    details, business logic ValueErrors return 400 with their message, and
+    anything unexpected returns a generic 500 to avoid leaking internals.
+    """
+    exc_type = next(cls for cls in type(exc).__mro__ if cls in _ERROR_RESPONSES)
+    status_code, error, message, with_details = _ERROR_RESPONSES[exc_type]
+
+    content: dict[str, Any] = {"error": error, "message": str(exc) if message is None else message}
+    if with_details and isinstance(exc, (RequestValidationError, ValidationError)):
+        content["details"] = [
+            {
+                "field": ".".join(str(loc) for loc in err["loc"]),
+                "message": err["msg"],
+                "type": err["type"],
+            }
+            for err in exc.errors()
+        ]
+    content["timestamp"] = datetime.now()
+    content["path"] = request.url.path
+
+    return ORJSONResponse(status_code=status_code, content=content)
+
+
 # Create FastAPI app
 app = FastAPI(
     title="Arboric API",
@@ -41,6 +86,8 @@ Currently no authentication required. This will be added in future versions for
 No rate limiting currently enforced.
     """,
     version="0.1.0",
+    default_response_class=ORJSONResponse,
+    exception_handlers={exc_type: error_handler for exc_type in _ERROR_RESPONSES},
     docs_url="/docs",
     redoc_url="/redoc",
     contact={"name": "Arboric Team", "email": "aashan5050@gmail.com"},
@@ -56,6 +103,9 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Compress larger payloads (forecast rows and fleet schedules compress well)
+app.add_middleware(GZipMiddleware, minimum_size=1024, compresslevel=5)
+
 # Include routers
 app.include_router(optimize.router, prefix="/api/v1", tags=["Optimization"])
 app.include_router(receipt.router, prefix="/api/v1", tags=["Receipts"])
@@ -65,6 +115,25 @@ app.include_router(status.router, prefix="/api/v1", tags=["Status"])
 app.include_router(config.router, prefix="/api/v1", tags=["Configuration"])
 app.include_router(history.router, prefix="/api/v1", tags=["History"])
 
+
+@app.on_event("startup")
+async def _warm_up() -> None:
+    """
+    Pay one-off costs before the first request instead of during it.
+
+    Compiles the optimization kernels and pre-generates the simulated grid
+    forecasts for every region. Set ARBORIC_WARMUP=0 to skip (e.g. for
+    short-lived test servers).
+    """
+    if os.environ.get("ARBORIC_WARMUP", "1") == "0":
+        return
+    warm_up_kernels()
+    try:
+        warm_forecast_cache(get_arboric_config())
+    except Exception as exc:
+        logger.warning("Forecast cache warm-up skipped: %s", exc)
+
+
 # Conditionally load cloud routes if arboric-cloud is installed
 try:
     from arboric_cloud.api.routes import auth as auth_route
@@ -160,97 +229,4 @@ async def health():
 
     Simple endpoint for load balancers and monitoring systems to check if the API is responsive.
     """
-    return {"status": "healthy", "timestamp": datetime.now().isoformat()}
-
-
-# Exception handlers
-@app.exception_handler(RequestValidationError)
-async def request_validation_exception_handler(request: Request, exc: RequestValidationError):
-    """
-    Handle FastAPI request validation errors.
-
-    Converts FastAPI validation errors into a structured JSON response
-    with field-level error details.
-    """
-    return JSONResponse(
-        status_code=422,
-        content={
-            "error": "ValidationError",
-            "message": "Request validation failed",
-            "details": [
-                {
-                    "field": ".".join(str(loc) for loc in err["loc"]),
-                    "message": err["msg"],
-                    "type": err["type"],
-                }
-                for err in exc.errors()
-            ],
-            "timestamp": datetime.now().isoformat(),
-            "path": str(request.url.path),
-        },
-    )
-
-
-@app.exception_handler(ValidationError)
-async def validation_exception_handler(request: Request, exc: ValidationError):
-    """
-    Handle Pydantic validation errors.
-
-    Converts Pydantic validation errors into a structured JSON response
-    with field-level error details.
-    """
-    return JSONResponse(
-        status_code=422,
-        content={
-            "error": "ValidationError",
-            "message": "Request validation failed",
-            "details": [
-                {
-                    "field": ".".join(str(loc) for loc in err["loc"]),
-                    "message": err["msg"],
-                    "type": err["type"],
-                }
-                for err in exc.errors()
-            ],
-            "timestamp": datetime.now().isoformat(),
-            "path": str(request.url.path),
-        },
-    )
-
-
-@app.exception_handler(ValueError)
-async def value_error_handler(request: Request, exc: ValueError):
-    """
-    Handle business logic errors.
-
-    Converts ValueError exceptions (used for business logic validation)
-    into structured error responses.
-    """
-    return JSONResponse(
-        status_code=400,
-        content={
-            "error": "ValueError",
-            "message": str(exc),
-            "timestamp": datetime.now().isoformat(),
-            "path": str(request.url.path),
-        },
-    )
-
-
-@app.exception_handler(Exception)
-async def generic_exception_handler(request: Request, exc: Exception):
-    """
-    Handle unexpected errors.
-
-    Catches any unexpected exceptions and returns a generic error response
-    to avoid leaking internal details.
-    """
-    return JSONResponse(
-        status_code=500,
-        content={
-            "error": "InternalServerError",
-            "message": "An unexpected error occurred",
-            "timestamp": datetime.now().isoformat(),
-            "path": str(request.url.path),
-        },
-    )
+    return {"status": "healthy", "timestamp": datetime.now()}
@@ -2,30 +2,26 @@
 Configuration endpoint.
 """
 
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Request, Response, status
 
 from arboric.api.dependencies import get_arboric_config
-from arboric.api.utils import create_api_response
+from arboric.api.utils import create_api_response, dumps_json, etag_matches, make_etag
 from arboric.core.config import ArboricConfig
 
 router = APIRouter()
 
+# Longest time clients may reuse the config without revalidating
+CONFIG_MAX_AGE_SECONDS = 300
 
-@router.get("/config")
-async def get_config(config: ArboricConfig = Depends(get_arboric_config)):
-    """
-    Get current Arboric configuration.
-
-    Returns optimization settings, default workload parameters,
-    and API configuration.
+# Response payload and its ETag built from the last-seen config object. The
+# global config is only replaced on reload, so an identity check is enough
+# to invalidate.
+_cached_payload: tuple[ArboricConfig, dict, str] | None = None
 
-    Args:
-        config: Arboric configuration (injected)
 
-    Returns:
-        Standardized API response with configuration data
-    """
-    data = {
+def _build_config_payload(config: ArboricConfig) -> dict:
+    """Build the /config response payload from an ArboricConfig."""
+    return {
         "optimization": {
             "cost_weight": config.optimization.cost_weight,
             "carbon_weight": config.optimization.carbon_weight,
@@ -41,4 +37,44 @@ async def get_config(config: ArboricConfig = Depends(get_arboric_config)):
         "live_data": {"enabled": config.live_data.enabled},
     }
 
-    return create_api_response("config", data)
+
+def _get_config_payload(config: ArboricConfig) -> tuple[dict, str]:
+    """Return the cached payload and ETag for this config, rebuilding after a reload."""
+    global _cached_payload
+
+    if _cached_payload is None or _cached_payload[0] is not config:
+        payload = _build_config_payload(config)
+        _cached_payload = (config, payload, make_etag(dumps_json(payload).decode()))
+
+    return _cached_payload[1], _cached_payload[2]
+
+
+@router.get("/config")
+async def get_config(
+    request: Request,
+    response: Response,
+    config: ArboricConfig = Depends(get_arboric_config),
+):
+    """
+    Get current Arboric configuration.
+
+    Returns optimization settings, default workload parameters,
+    and API configuration. Answers a matching If-None-Match with
+    304 Not Modified.
+
+    Args:
+        request: Incoming request (for conditional headers)
+        response: Outgoing response (for cache headers)
+        config: Arboric configuration (injected)
+
+    Returns:
+        Standardized API response with configuration data
+    """
+    payload, etag = _get_config_payload(config)
+    headers = {"ETag": etag, "Cache-Control": f"public, max-age={CONFIG_MAX_AGE_SECONDS}"}
+
+    if etag_matches(request, etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+
+    response.headers.update(headers)
+    return create_api_response("config", payload)
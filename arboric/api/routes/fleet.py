@@ -2,23 +2,20 @@
 Fleet optimization endpoint.
 """
 
-from datetime import datetime
-from datetime import timezone as tz
-
 from fastapi import APIRouter, Depends, HTTPException, status
 
+from arboric.api.cache import get_forecast, get_shared_grid
 from arboric.api.dependencies import get_autopilot
 from arboric.api.models.requests import FleetOptimizeRequest
 from arboric.api.utils import create_api_response, serialize_fleet_for_api
 from arboric.core.autopilot import Autopilot
 from arboric.core.config import get_config
-from arboric.core.grid_oracle import get_grid
 
 router = APIRouter()
 
 
 @router.post("/optimize")
-async def optimize_fleet(
+def optimize_fleet(
     request: FleetOptimizeRequest,
     autopilot: Autopilot = Depends(get_autopilot),
 ):
@@ -47,20 +44,14 @@ async def optimize_fleet(
             instance_type = request.workloads[0].instance_type
             cloud_provider = request.workloads[0].cloud_provider
 
-        grid = get_grid(
+        grid = get_shared_grid(
             region=request.region,
             config=get_config(),
             instance_type=instance_type,
             cloud_provider=cloud_provider,
         )
         forecast_hours = request.forecast_hours or 48
-        # Pass appropriate time based on grid type
-        now_local = datetime.now().replace(minute=0, second=0, microsecond=0)
-        if getattr(grid, "is_live", False):
-            now_for_forecast = now_local.astimezone(tz.utc).replace(tzinfo=None)
-        else:
-            now_for_forecast = now_local
-        forecast = grid.get_forecast(hours=forecast_hours, start_time=now_for_forecast)
+        forecast = get_forecast(grid, forecast_hours)
 
         # Run fleet optimization
         result = autopilot.optimize_fleet(request.workloads, forecast)
@@ -2,20 +2,70 @@
 Grid forecast endpoint.
 """
 
+from collections.abc import Iterator
 from datetime import datetime
-from datetime import timezone as tz
 
-from fastapi import APIRouter, HTTPException, Query, status
+from fastapi import APIRouter, HTTPException, Query, Request, Response, status
+from fastapi.responses import StreamingResponse
 
-from arboric.api.utils import create_api_response
+from arboric.api.cache import forecast_cache_key, get_forecast_records, get_shared_grid
+from arboric.api.utils import create_api_response, dumps_json, etag_matches, make_etag
 from arboric.core.config import get_config
-from arboric.core.grid_oracle import get_grid
 
 router = APIRouter()
 
+# Rows encoded per streamed chunk (one day of hourly data)
+STREAM_CHUNK_ROWS = 24
+
+# Longest time clients may reuse a forecast without revalidating
+FORECAST_MAX_AGE_SECONDS = 300
+
+
+def _cache_headers(cache_key: tuple) -> dict[str, str]:
+    """
+    Build ETag and Cache-Control headers for a reproducible forecast.
+
+    The forecast rolls over on the hour, so max-age never reaches past it.
+    """
+    now = datetime.now()
+    seconds_to_next_hour = 3600 - (now.minute * 60 + now.second)
+    max_age = min(FORECAST_MAX_AGE_SECONDS, seconds_to_next_hour)
+    return {
+        "ETag": make_etag(*cache_key),
+        "Cache-Control": f"public, max-age={max_age}",
+    }
+
+
+def _stream_forecast(metadata: dict, forecast_data: list[dict]) -> Iterator[bytes]:
+    """
+    Stream the forecast response as a single JSON document.
+
+    Yields the standard response envelope up to the opening bracket of the
+    row list, then the rows a chunk at a time, then the closing brackets, so
+    large forecasts are never encoded into one buffer.
+
+    Args:
+        metadata: Forecast metadata section
+        forecast_data: Forecast rows
+
+    Yields:
+        Encoded JSON fragments
+    """
+    # "data" is the last key of both the envelope and the payload, so the
+    # encoded envelope ends with the empty row list: ...[]}}
+    envelope = dumps_json(create_api_response("forecast", {"metadata": metadata, "data": []}))
+    yield envelope[:-3]
+
+    for offset in range(0, len(forecast_data), STREAM_CHUNK_ROWS):
+        chunk = dumps_json(forecast_data[offset : offset + STREAM_CHUNK_ROWS])[1:-1]
+        yield chunk if offset == 0 else b"," + chunk
+
+    yield envelope[-3:]
+
 
 @router.get("/forecast")
-async def get_forecast(
+def get_forecast(
+    request: Request,
     region: str = Query(default="eastus", description="Grid region"),
     hours: int = Query(default=24, ge=1, le=168, description="Forecast hours (1-168)"),
 ):
@@ -23,44 +73,45 @@ async def get_forecast(
     Get grid electricity forecast for a region.
 
     Returns hourly forecast data including carbon intensity, price,
-    renewable percentage, and confidence scores.
+    renewable percentage, and confidence scores. The response body is
+    streamed row chunk by row chunk. Simulated forecasts carry an ETag and
+    answer a matching If-None-Match with 304 Not Modified.
 
     Args:
+        request: Incoming request (for conditional headers)
         region: Grid region (eastus, westus2, uksouth, northeurope)
         hours: Number of forecast hours (1-168)
 
     Returns:
-        Standardized API response with forecast data
+        Streaming standardized API response with forecast data
 
     Raises:
         HTTPException: 400 for invalid region, 500 for unexpected errors
     """
     try:
         # Get grid forecast
-        grid = get_grid(region=region, config=get_config())
-        # Pass appropriate time based on grid type
-        now_local = datetime.now().replace(minute=0, second=0, microsecond=0)
-        if getattr(grid, "is_live", False):
-            now_for_forecast = now_local.astimezone(tz.utc).replace(tzinfo=None)
-        else:
-            now_for_forecast = now_local
-        forecast_df = grid.get_forecast(hours=hours, start_time=now_for_forecast)
-
-        # Convert DataFrame to list of dicts
-        forecast_data = forecast_df.reset_index().to_dict(orient="records")
-
-        # Format response
-        data = {
-            "metadata": {
-                "region": region,
-                "hours": hours,
-                "data_points": len(forecast_data),
-                "resolution_minutes": 60,
-            },
-            "data": forecast_data,
+        grid = get_shared_grid(region=region, config=get_config())
+
+        # Live forecasts may change at any time and are never cached
+        cache_key = forecast_cache_key(grid, hours)
+        headers = _cache_headers(cache_key) if cache_key is not None else None
+        if headers is not None and etag_matches(request, headers["ETag"]):
+            return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+
+        forecast_data = get_forecast_records(grid, hours)
+
+        metadata = {
+            "region": region,
+            "hours": hours,
+            "data_points": len(forecast_data),
+            "resolution_minutes": 60,
         }
 
-        return create_api_response("forecast", data)
+        return StreamingResponse(
+            _stream_forecast(metadata, forecast_data),
+            media_type="application/json",
+            headers=headers,
+        )
 
     except ValueError as e:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
@@ -20,7 +20,7 @@ router = APIRouter()
 
 
 @router.get("/history")
-async def get_history(
+def get_history(
     limit: int = Query(20, ge=1, le=500, description="Max results"),
     since_days: int | None = Query(30, description="Days to look back (None = all time)"),
     region: str | None = Query(None, description="Filter by region (eastus, westus2, etc)"),
@@ -56,7 +56,7 @@ async def get_history(
 
 
 @router.get("/insights")
-async def get_insights(
+def get_insights(
     since_days: int | None = Query(30, description="Days to look back (None = all time)"),
     region: str | None = Query(None, description="Filter by region (optional)"),
     config: ArboricConfig = Depends(get_arboric_config),
@@ -2,26 +2,81 @@
 Single workload optimization endpoint.
 """
 
-from datetime import datetime
-from datetime import timezone as tz
+from functools import lru_cache
 
 from fastapi import APIRouter, Depends, HTTPException, status
 
+from arboric.api.cache import (
+    forecast_cache_key,
+    get_forecast,
+    get_forecast_for_key,
+    get_shared_grid,
+)
 from arboric.api.dependencies import get_autopilot
 from arboric.api.models.requests import OptimizeRequest
 from arboric.api.utils import (
     create_api_response,
     serialize_schedule_for_api,
 )
-from arboric.core.autopilot import Autopilot
+from arboric.core.autopilot import Autopilot, OptimizationConfig
 from arboric.core.config import get_config
-from arboric.core.grid_oracle import get_grid
+from arboric.core.grid_oracle import MockGrid
+from arboric.core.models import ScheduleResult, Workload
 
 router = APIRouter()
 
+# Workload fields that determine the schedule; name, id and description
+# only appear in the response and are taken from the request.
+_SHAPE_FIELDS = (
+    "duration_hours",
+    "deadline_hours",
+    "power_draw_kw",
+    "priority",
+    "workload_type",
+    "instance_type",
+    "cloud_provider",
+)
+
+
+@lru_cache(maxsize=2048)
+def _optimize_shape(
+    shape: tuple, forecast_key: tuple, config_key: tuple[float, float, float, bool]
+) -> ScheduleResult:
+    """
+    Optimize a workload shape against a cached simulated forecast.
+
+    The forecast key pins region, seed and start hour, so the result is
+    reused for identical requests until the forecast rolls to the next hour.
+    """
+    workload = Workload(name="shape", **dict(zip(_SHAPE_FIELDS, shape)))
+    autopilot = Autopilot(config=OptimizationConfig(*config_key), enable_log=False)
+    return autopilot.optimize_schedule(workload, get_forecast_for_key(forecast_key))
+
+
+def _schedule(
+    autopilot: Autopilot, workload: Workload, grid: MockGrid, forecast_hours: int
+) -> ScheduleResult:
+    """Optimize a workload, reusing results for simulated grids."""
+    forecast_key = forecast_cache_key(grid, forecast_hours)
+    if forecast_key is None:
+        return autopilot.optimize_schedule(workload, get_forecast(grid, forecast_hours))
+
+    config = autopilot.config
+    result = _optimize_shape(
+        tuple(getattr(workload, field) for field in _SHAPE_FIELDS),
+        forecast_key,
+        (
+            config.cost_weight,
+            config.carbon_weight,
+            config.min_delay_hours,
+            config.prefer_continuous,
+        ),
+    )
+    return result.model_copy(update={"workload": workload})
+
 
 @router.post("/optimize")
-async def optimize_workload(
+def optimize_workload(
     request: OptimizeRequest,
     autopilot: Autopilot = Depends(get_autopilot),
 ):
@@ -51,23 +106,16 @@ async def optimize_workload(
             region = comparison.cheapest_region
 
         # Get grid forecast
-        grid = get_grid(
+        grid = get_shared_grid(
             region=region,
             config=get_config(),
             instance_type=request.workload.instance_type,
             cloud_provider=request.workload.cloud_provider,
         )
         forecast_hours = request.forecast_hours or 48
-        # Pass appropriate time based on grid type
-        now_local = datetime.now().replace(minute=0, second=0, microsecond=0)
-        if getattr(grid, "is_live", False):
-            now_for_forecast = now_local.astimezone(tz.utc).replace(tzinfo=None)
-        else:
-            now_for_forecast = now_local
-        forecast = grid.get_forecast(hours=forecast_hours, start_time=now_for_forecast)
 
         # Run optimization
-        result = autopilot.optimize_schedule(request.workload, forecast)
+        result = _schedule(autopilot, request.workload, grid, forecast_hours)
 
         # Serialize and return (pass region and runs_per_week)
         data = serialize_schedule_for_api(result, request.runs_per_week, region=region)
@@ -3,24 +3,22 @@ Certified Carbon Receipt endpoint (Enterprise).
 """
 
 import base64
-from datetime import datetime
-from datetime import timezone as tz
 
 from fastapi import APIRouter, Depends, HTTPException, status
 
+from arboric.api.cache import get_forecast, get_shared_grid
 from arboric.api.dependencies import get_autopilot
 from arboric.api.models.requests import OptimizeRequest
 from arboric.api.utils import create_api_response
 from arboric.core.autopilot import Autopilot
 from arboric.core.config import get_config
-from arboric.core.grid_oracle import get_grid
 from arboric.receipts.exceptions import EnterpriseFeatureNotAvailableError
 
 router = APIRouter()
 
 
 @router.post("/receipt")
-async def generate_receipt_endpoint(
+def generate_receipt_endpoint(
     request: OptimizeRequest,
     autopilot: Autopilot = Depends(get_autopilot),
 ):
@@ -54,15 +52,9 @@ async def generate_receipt_endpoint(
             )
 
         # Get grid forecast
-        grid = get_grid(region=request.region, config=get_config())
+        grid = get_shared_grid(region=request.region, config=get_config())
         forecast_hours = request.forecast_hours or 48
-        # Pass appropriate time based on grid type
-        now_local = datetime.now().replace(minute=0, second=0, microsecond=0)
-        if getattr(grid, "is_live", False):
-            now_for_forecast = now_local.astimezone(tz.utc).replace(tzinfo=None)
-        else:
-            now_for_forecast = now_local
-        forecast = grid.get_forecast(hours=forecast_hours, start_time=now_for_forecast)
+        forecast = get_forecast(grid, forecast_hours)
 
         # Run optimization
         schedule = autopilot.optimize_schedule(request.workload, forecast)
@@ -75,8 +67,8 @@ async def generate_receipt_endpoint(
 
         # Build response
         data = {
-            "receipt_id": str(carbon_receipt.receipt_id),
-            "generated_at": carbon_receipt.generated_at.isoformat(),
+            "receipt_id": carbon_receipt.receipt_id,
+            "generated_at": carbon_receipt.generated_at,
             "compliance_framework": carbon_receipt.compliance_framework,
             "moer_data_source": carbon_receipt.moer_data_source,
             "workload": {
@@ -86,10 +78,10 @@ async def generate_receipt_endpoint(
                 "duration_hours": carbon_receipt.workload.duration_hours,
             },
             "optimization": {
-                "optimal_start": carbon_receipt.optimal_start.isoformat(),
-                "optimal_end": carbon_receipt.optimal_end.isoformat(),
-                "baseline_start": carbon_receipt.baseline_start.isoformat(),
-                "baseline_end": carbon_receipt.baseline_end.isoformat(),
+                "optimal_start": carbon_receipt.optimal_start,
+                "optimal_end": carbon_receipt.optimal_end,
+                "baseline_start": carbon_receipt.baseline_start,
+                "baseline_end": carbon_receipt.baseline_end,
             },
             "metrics": {
                 "cost_savings": carbon_receipt.cost_savings,
@@ -105,7 +97,7 @@ async def generate_receipt_endpoint(
                 "algorithm": carbon_receipt.signature.algorithm,
                 "public_key_fingerprint": carbon_receipt.signature.public_key_fingerprint,
                 "data_hash": carbon_receipt.signature.data_hash,
-                "signed_at": carbon_receipt.signature.signed_at.isoformat(),
+                "signed_at": carbon_receipt.signature.signed_at,
             }
             if carbon_receipt.signature
             else None,
@@ -15,22 +15,13 @@ router = APIRouter()
 # Track server start time
 _server_start_time = datetime.now()
 
+# Static status sections built from the last-seen config object. Only the
+# uptime changes between requests; a config reload replaces the object.
+_cached_sections: tuple[ArboricConfig, dict] | None = None
 
-@router.get("/status")
-async def get_status(config: ArboricConfig = Depends(get_arboric_config)):
-    """
-    Get system status and configuration information.
-
-    Returns health status, component availability, and supported regions.
-
-    Args:
-        config: Arboric configuration (injected)
-
-    Returns:
-        Standardized API response with status information
-    """
-    uptime_seconds = (datetime.now() - _server_start_time).total_seconds()
 
+def _build_static_sections(config: ArboricConfig) -> dict:
+    """Build the config-derived (non-uptime) sections of the /status payload."""
     # Determine grid mode and data sources
     live_data_config = config.live_data
     grid_mode = "live" if live_data_config.enabled else "simulation"
@@ -47,13 +38,7 @@ async def get_status(config: ArboricConfig = Depends(get_arboric_config)):
         "Live Data (Carbon + Pricing)" if live_data_config.enabled else "Simulated Data"
     )
 
-    data = {
-        "service": {
-            "name": "arboric-api",
-            "version": "0.1.0",
-            "status": "online",
-            "uptime_seconds": uptime_seconds,
-        },
+    return {
         "components": {
             "grid_oracle": {
                 "status": "online",
@@ -72,4 +57,42 @@ async def get_status(config: ArboricConfig = Depends(get_arboric_config)):
         },
     }
 
+
+def _get_static_sections(config: ArboricConfig) -> dict:
+    """Return the cached static sections for this config, rebuilding after a reload."""
+    global _cached_sections
+
+    if _cached_sections is None or _cached_sections[0] is not config:
+        _cached_sections = (config, _build_static_sections(config))
+
+    return _cached_sections[1]
+
+
+@router.get("/status")
+async def get_status(config: ArboricConfig = Depends(get_arboric_config)):
+    """
+    Get system status and configuration information.
+
+    Returns health status, component availability, and supported regions.
+
+    Args:
+        config: Arboric configuration (injected)
+
+    Returns:
+        Standardized API response with status information
+    """
+    uptime_seconds = (datetime.now() - _server_start_time).total_seconds()
+    sections = _get_static_sections(config)
+
+    data = {
+        "service": {
+            "name": "arboric-api",
+            "version": "0.1.0",
+            "status": "online",
+            "uptime_seconds": uptime_seconds,
+        },
+        "components": sections["components"],
+        "configuration": sections["configuration"],
+    }
+
     return create_api_response("status", data)
@@ -1,14 +1,81 @@
 """
 API utility functions for serialization and response formatting.
 
-Reuses serialization logic from arboric.cli.export to maintain consistency
-between API responses and export formats.
+Responses expose the same fields and computed properties as the
+arboric.cli.export formats, read directly off the result models.
 """
 
+import hashlib
 from datetime import datetime
+from typing import Any
 
-from arboric.cli.export import _serialize_fleet_result, _serialize_schedule_result
-from arboric.core.models import FleetOptimizationResult, RegionComparisonResult, ScheduleResult
+import orjson
+from fastapi import Request
+from fastapi.responses import JSONResponse
+
+from arboric.core.models import (
+    FleetOptimizationResult,
+    RegionComparisonResult,
+    ScheduleResult,
+    Workload,
+)
+
+
+def dumps_json(content: Any) -> bytes:
+    """
+    Encode content to JSON bytes with orjson.
+
+    Serializes datetimes, UUIDs and NumPy scalars natively.
+    """
+    return orjson.dumps(content, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY)
+
+
+class ORJSONResponse(JSONResponse):
+    """
+    JSON response rendered with orjson.
+
+    Several times faster than the stdlib encoder used by JSONResponse.
+    """
+
+    def render(self, content: Any) -> bytes:
+        return dumps_json(content)
+
+
+def make_etag(*parts: Any) -> str:
+    """
+    Build a weak ETag from the values that determine a response's content.
+
+    Weak because the response envelope carries a per-request timestamp, so
+    matching responses are equivalent rather than byte-identical.
+
+    Args:
+        *parts: Values identifying the response content
+
+    Returns:
+        ETag header value
+    """
+    digest = hashlib.blake2b(":".join(map(str, parts)).encode(), digest_size=8).hexdigest()
+    return f'W/"{digest}"'
+
+
+def etag_matches(request: Request, etag: str) -> bool:
+    """
+    Check a request's If-None-Match header against an ETag.
+
+    Args:
+        request: Incoming request
+        etag: Current ETag of the resource
+
+    Returns:
+        True if the client's cached copy is still current (respond 304)
+    """
+    if_none_match = request.headers.get("if-none-match")
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    opaque_tag = etag.removeprefix("W/")
+    return any(tag.strip().removeprefix("W/") == opaque_tag for tag in if_none_match.split(","))
 
 
 def create_api_response(command: str, data: dict) -> dict:
@@ -32,20 +99,28 @@ def create_api_response(command: str, data: dict) -> dict:
     """
     return {
         "command": command,
-        "timestamp": datetime.now().isoformat(),
+        "timestamp": datetime.now(),
         "version": "0.1.0",
         "data": data,
     }
 
 
+def _serialize_workload(workload: Workload) -> dict:
+    """Dump a Workload including its computed energy_kwh property."""
+    data = workload.model_dump()
+    data["energy_kwh"] = workload.energy_kwh
+    return data
+
+
 def serialize_schedule_for_api(
     result: ScheduleResult, runs_per_week: float | None = None, region: str | None = None
 ) -> dict:
     """
     Serialize ScheduleResult for API response.
 
-    Reuses export module's serialization logic to ensure computed properties
-    are included (cost_savings, carbon_savings_kg, delay_hours, etc.).
+    Reads fields and computed properties (cost_savings, carbon_savings_kg,
+    delay_hours, etc.) straight off the result; only the nested workload
+    goes through model_dump().
 
     Args:
         result: ScheduleResult to serialize
@@ -55,44 +130,44 @@ def serialize_schedule_for_api(
     Returns:
         Structured dictionary with workload, optimization, and metrics sections
     """
-    data = _serialize_schedule_result(result)
+    cost_savings = result.cost_savings
 
     # Build savings dict with optional annual projection
-    savings = {
-        "cost": data["cost_savings"],  # Computed property
-        "cost_percent": data["cost_savings_percent"],  # Computed property
-        "carbon_kg": data["carbon_savings_kg"],  # Computed property
-        "carbon_percent": data["carbon_savings_percent"],  # Computed property
+    savings: dict[str, Any] = {
+        "cost": cost_savings,
+        "cost_percent": result.cost_savings_percent,
+        "carbon_kg": result.carbon_savings_kg,
+        "carbon_percent": result.carbon_savings_percent,
     }
     if runs_per_week is not None:
-        savings["annual_cost_savings"] = data["cost_savings"] * runs_per_week * 52 * 0.80
+        savings["annual_cost_savings"] = cost_savings * runs_per_week * 52 * 0.80
         savings["annual_projection_basis"] = f"{runs_per_week} runs/week × 52 weeks"
 
     return {
         "region": region or "unknown",
         "on_demand_rate_per_hr": result.on_demand_rate_per_hr,
-        "workload": data["workload"],
+        "workload": _serialize_workload(result.workload),
         "optimization": {
-            "optimal_start": data["optimal_start"],
-            "optimal_end": data["optimal_end"],
-            "baseline_start": data["baseline_start"],
-            "baseline_end": data["baseline_end"],
-            "delay_hours": data["delay_hours"],  # Computed property
-            "optimal_start_clock": data.get("optimal_start_clock"),  # Computed property
-            "deadline_slack_hours": data.get("deadline_slack_hours"),  # Computed property
+            "optimal_start": result.optimal_start,
+            "optimal_end": result.optimal_end,
+            "baseline_start": result.baseline_start,
+            "baseline_end": result.baseline_end,
+            "delay_hours": result.delay_hours,
+            "optimal_start_clock": result.optimal_start_clock,
+            "deadline_slack_hours": result.deadline_slack_hours,
         },
         "metrics": {
             "optimized": {
-                "cost": data["optimized_cost"],
-                "carbon_kg": data["optimized_carbon_kg"],
-                "avg_price": data["optimized_avg_price"],
-                "avg_carbon": data["optimized_avg_carbon"],
+                "cost": result.optimized_cost,
+                "carbon_kg": result.optimized_carbon_kg,
+                "avg_price": result.optimized_avg_price,
+                "avg_carbon": result.optimized_avg_carbon,
             },
             "baseline": {
-                "cost": data["baseline_cost"],
-                "carbon_kg": data["baseline_carbon_kg"],
-                "avg_price": data["baseline_avg_price"],
-                "avg_carbon": data["baseline_avg_carbon"],
+                "cost": result.baseline_cost,
+                "carbon_kg": result.baseline_carbon_kg,
+                "avg_price": result.baseline_avg_price,
+                "avg_carbon": result.baseline_avg_carbon,
             },
             "savings": savings,
         },
@@ -105,6 +180,8 @@ def serialize_fleet_for_api(
     """
     Serialize FleetOptimizationResult for API response.
 
+    Each schedule is serialized exactly once, by serialize_schedule_for_api.
+
     Args:
         result: FleetOptimizationResult to serialize
         runs_per_week: Optional job frequency for annual savings projection
@@ -112,16 +189,14 @@ def serialize_fleet_for_api(
     Returns:
         Structured dictionary with summary and schedules sections
     """
-    data = _serialize_fleet_result(result)
-
     return {
         "summary": {
-            "total_workloads": data["total_workloads"],
-            "total_cost_savings": data["total_cost_savings"],
-            "total_carbon_savings_kg": data["total_carbon_savings_kg"],
-            "average_cost_savings_percent": data["average_cost_savings_percent"],  # Computed
-            "average_carbon_savings_percent": data["average_carbon_savings_percent"],  # Computed
-            "optimization_timestamp": data["optimization_timestamp"],
+            "total_workloads": result.total_workloads,
+            "total_cost_savings": result.total_cost_savings,
+            "total_carbon_savings_kg": result.total_carbon_savings_kg,
+            "average_cost_savings_percent": result.average_cost_savings_percent,
+            "average_carbon_savings_percent": result.average_carbon_savings_percent,
+            "optimization_timestamp": result.optimization_timestamp,
         },
         "schedules": [
             serialize_schedule_for_api(schedule, runs_per_week) for schedule in result.schedules
@@ -161,5 +236,5 @@ def serialize_region_comparison(result: RegionComparisonResult) -> dict:
             }
             for entry in result.entries
         ],
-        "generated_at": result.generated_at.isoformat(),
+        "generated_at": result.generated_at,
     }
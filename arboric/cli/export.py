@@ -6,16 +6,80 @@ to various formats (JSON, CSV) for integration and analysis.
 """
 
 import csv
-import json
 import sys
+from collections.abc import Iterator
 from datetime import datetime
 from enum import Enum
+from functools import lru_cache
 from pathlib import Path
+from typing import IO, Any
 
+import numpy as np
+import orjson
 import pandas as pd
 
 from arboric.core.models import FleetOptimizationResult, ScheduleResult
 
+# Buffer size for export files, so large fleet CSVs hit the disk in a few
+# large writes instead of one per row
+WRITE_BUFFER_SIZE = 1 << 20
+
+# Output directories already created by this process
+_ensured_dirs: set[Path] = set()
+
+# Leading CSV columns shared by schedule and fleet summary rows
+_CSV_HEADER_FIELDS = ("command", "timestamp", "version")
+
+# CSV columns for a single schedule, in output order
+_SCHEDULE_CSV_FIELDS = (
+    *_CSV_HEADER_FIELDS,
+    "workload_id",
+    "workload_name",
+    "workload_duration_hours",
+    "workload_power_draw_kw",
+    "workload_energy_kwh",
+    "workload_deadline_hours",
+    "workload_type",
+    "workload_priority",
+    "workload_description",
+    "optimal_start",
+    "optimal_end",
+    "baseline_start",
+    "baseline_end",
+    "delay_hours",
+    "optimized_cost",
+    "optimized_carbon_kg",
+    "optimized_avg_price",
+    "optimized_avg_carbon",
+    "baseline_cost",
+    "baseline_carbon_kg",
+    "baseline_avg_price",
+    "baseline_avg_carbon",
+    "cost_savings",
+    "cost_savings_percent",
+    "carbon_savings_kg",
+    "carbon_savings_percent",
+)
+
+# CSV columns of the fleet summary row
+_FLEET_SUMMARY_CSV_FIELDS = (
+    "record_type",
+    *_CSV_HEADER_FIELDS,
+    "fleet_total_workloads",
+    "fleet_total_cost_savings",
+    "fleet_total_carbon_savings_kg",
+    "fleet_avg_cost_savings_percent",
+    "fleet_avg_carbon_savings_percent",
+    "fleet_optimization_timestamp",
+)
+
+# Fleet CSV header: summary columns, then the schedule columns of the detail rows
+_FLEET_CSV_FIELDS = (*_FLEET_SUMMARY_CSV_FIELDS, *_SCHEDULE_CSV_FIELDS[len(_CSV_HEADER_FIELDS) :])
+
+# Empty cells for the columns a fleet CSV row type does not fill
+_FLEET_SUMMARY_PADDING = ("",) * (len(_FLEET_CSV_FIELDS) - len(_FLEET_SUMMARY_CSV_FIELDS))
+_FLEET_DETAIL_PADDING = ("",) * (len(_FLEET_SUMMARY_CSV_FIELDS) - len(_CSV_HEADER_FIELDS) - 1)
+
 
 class ExportFormat(str, Enum):
     """Supported export formats."""
@@ -24,12 +88,20 @@ class ExportFormat(str, Enum):
     CSV = "csv"
 
 
+# File extension to export format, for detect_format
+_FORMAT_BY_SUFFIX = {
+    ".json": ExportFormat.JSON,
+    ".csv": ExportFormat.CSV,
+}
+
+
 class ExportError(Exception):
     """Raised when export operation fails."""
 
     pass
 
 
+@lru_cache(maxsize=1024)
 def detect_format(output_path: str) -> ExportFormat | None:
     """
     Auto-detect export format from file extension.
@@ -43,20 +115,90 @@ def detect_format(output_path: str) -> ExportFormat | None:
     if output_path == "-":
         return None  # Stdout requires explicit format
 
-    path = Path(output_path)
-    ext = path.suffix.lower()
+    return _FORMAT_BY_SUFFIX.get(Path(output_path).suffix.lower())
 
-    format_map = {
-        ".json": ExportFormat.JSON,
-        ".csv": ExportFormat.CSV,
-    }
 
-    return format_map.get(ext)
+def _open_output(output_path: Path, mode: str, **kwargs: Any) -> IO:
+    """
+    Open an export file, creating its parent directory once per process.
+
+    Repeated exports into the same directory skip the mkdir call; if the
+    directory was removed since, it is recreated and the open retried.
+
+    Args:
+        output_path: Path of the file to write
+        mode: File mode passed to open()
+        **kwargs: Extra arguments for open() (buffering, newline, ...)
+
+    Returns:
+        Open file object
+    """
+    parent = output_path.parent
+    if parent not in _ensured_dirs:
+        parent.mkdir(parents=True, exist_ok=True)
+        _ensured_dirs.add(parent)
+    try:
+        return open(output_path, mode, **kwargs)
+    except FileNotFoundError:
+        parent.mkdir(parents=True, exist_ok=True)
+        return open(output_path, mode, **kwargs)
+
+
+def _export_timestamp() -> str:
+    """Current local time as an ISO string, to the second, for export metadata."""
+    return datetime.now().isoformat(timespec="seconds")
+
+
+def _dumps(json_data: dict) -> bytes:
+    """
+    Encode export data as indented JSON with orjson.
+
+    Datetimes are passed through to str() so they keep the same
+    "YYYY-MM-DD HH:MM:SS" format the stdlib encoder produced.
+
+    Args:
+        json_data: Structured export dictionary
+
+    Returns:
+        UTF-8 encoded JSON indented by two spaces
+    """
+    return orjson.dumps(
+        json_data, default=str, option=orjson.OPT_INDENT_2 | orjson.OPT_PASSTHROUGH_DATETIME
+    )
+
+
+def _computed_metrics(result: ScheduleResult) -> tuple[float, float, float, float, float]:
+    """
+    Compute a ScheduleResult's savings and delay properties in one pass.
+
+    Mirrors the cost_savings, carbon_savings_kg, cost_savings_percent,
+    carbon_savings_percent and delay_hours properties, but reads each field
+    once instead of going through a descriptor per property (the percent
+    properties re-evaluate the savings ones), which adds up over a fleet.
+
+    Args:
+        result: ScheduleResult to evaluate
+
+    Returns:
+        Tuple of (cost_savings, carbon_savings_kg, cost_savings_percent,
+        carbon_savings_percent, delay_hours)
+    """
+    baseline_cost = result.baseline_cost
+    baseline_carbon_kg = result.baseline_carbon_kg
+    cost_savings = baseline_cost - result.optimized_cost
+    carbon_savings_kg = baseline_carbon_kg - result.optimized_carbon_kg
+    return (
+        cost_savings,
+        carbon_savings_kg,
+        0.0 if baseline_cost == 0 else (cost_savings / baseline_cost) * 100,
+        0.0 if baseline_carbon_kg == 0 else (carbon_savings_kg / baseline_carbon_kg) * 100,
+        (result.optimal_start - result.baseline_start).total_seconds() / 3600,
+    )
 
 
 def _serialize_schedule_result(result: ScheduleResult) -> dict:
     """
-    Serialize ScheduleResult including computed properties.
+    Serialize ScheduleResult including the computed properties exports use.
 
     Pydantic's model_dump() doesn't include @property decorated fields,
     so we must add them explicitly.
@@ -65,21 +207,22 @@ def _serialize_schedule_result(result: ScheduleResult) -> dict:
         result: ScheduleResult to serialize
 
     Returns:
-        Dictionary with all fields including computed properties
+        Dictionary with all fields plus savings, delay and energy values
     """
     base_dict = result.model_dump()
 
     # Add computed properties from ScheduleResult
-    base_dict["cost_savings"] = result.cost_savings
-    base_dict["carbon_savings_kg"] = result.carbon_savings_kg
-    base_dict["cost_savings_percent"] = result.cost_savings_percent
-    base_dict["carbon_savings_percent"] = result.carbon_savings_percent
-    base_dict["delay_hours"] = result.delay_hours
-    base_dict["optimal_start_clock"] = result.optimal_start_clock
-    base_dict["deadline_slack_hours"] = result.deadline_slack_hours
+    (
+        base_dict["cost_savings"],
+        base_dict["carbon_savings_kg"],
+        base_dict["cost_savings_percent"],
+        base_dict["carbon_savings_percent"],
+        base_dict["delay_hours"],
+    ) = _computed_metrics(result)
 
     # Add computed property from nested Workload
-    base_dict["workload"]["energy_kwh"] = result.workload.energy_kwh
+    workload = base_dict["workload"]
+    workload["energy_kwh"] = workload["power_draw_kw"] * workload["duration_hours"]
 
     return base_dict
 
@@ -94,7 +237,8 @@ def _serialize_fleet_result(result: FleetOptimizationResult) -> dict:
     Returns:
         Dictionary with all fields including computed properties
     """
-    base_dict = result.model_dump()
+    # Schedules are dumped individually below; skip dumping them twice
+    base_dict = result.model_dump(exclude={"schedules"})
 
     # Add computed properties
     base_dict["average_cost_savings_percent"] = result.average_cost_savings_percent
@@ -106,63 +250,84 @@ def _serialize_fleet_result(result: FleetOptimizationResult) -> dict:
     return base_dict
 
 
-def _schedule_to_json(result: ScheduleResult, command: str = "optimize") -> dict:
+def _schedule_data(data: dict) -> dict:
+    """
+    Arrange a serialized ScheduleResult into the export "data" layout.
+
+    Args:
+        data: Output of _serialize_schedule_result()
+
+    Returns:
+        Dictionary with workload, optimization, and metrics sections
+    """
+    return {
+        "workload": data["workload"],
+        "optimization": {
+            "optimal_start": data["optimal_start"],
+            "optimal_end": data["optimal_end"],
+            "baseline_start": data["baseline_start"],
+            "baseline_end": data["baseline_end"],
+            "delay_hours": data["delay_hours"],
+        },
+        "metrics": {
+            "optimized": {
+                "cost": data["optimized_cost"],
+                "carbon_kg": data["optimized_carbon_kg"],
+                "avg_price": data["optimized_avg_price"],
+                "avg_carbon": data["optimized_avg_carbon"],
+            },
+            "baseline": {
+                "cost": data["baseline_cost"],
+                "carbon_kg": data["baseline_carbon_kg"],
+                "avg_price": data["baseline_avg_price"],
+                "avg_carbon": data["baseline_avg_carbon"],
+            },
+            "savings": {
+                "cost": data["cost_savings"],
+                "cost_percent": data["cost_savings_percent"],
+                "carbon_kg": data["carbon_savings_kg"],
+                "carbon_percent": data["carbon_savings_percent"],
+            },
+        },
+    }
+
+
+def _schedule_to_json(
+    result: ScheduleResult,
+    command: str = "optimize",
+    timestamp: str | None = None,
+) -> dict:
     """
     Convert ScheduleResult to structured JSON format.
 
     Args:
         result: ScheduleResult to convert
         command: Command that generated this result
+        timestamp: Export timestamp (ISO format); defaults to now
 
     Returns:
         Structured JSON dictionary
     """
-    data = _serialize_schedule_result(result)
-
     return {
         "command": command,
-        "timestamp": datetime.now().isoformat(),
+        "timestamp": timestamp or _export_timestamp(),
         "version": "0.1.0",
-        "data": {
-            "workload": data["workload"],
-            "optimization": {
-                "optimal_start": data["optimal_start"],
-                "optimal_end": data["optimal_end"],
-                "baseline_start": data["baseline_start"],
-                "baseline_end": data["baseline_end"],
-                "delay_hours": data["delay_hours"],
-            },
-            "metrics": {
-                "optimized": {
-                    "cost": data["optimized_cost"],
-                    "carbon_kg": data["optimized_carbon_kg"],
-                    "avg_price": data["optimized_avg_price"],
-                    "avg_carbon": data["optimized_avg_carbon"],
-                },
-                "baseline": {
-                    "cost": data["baseline_cost"],
-                    "carbon_kg": data["baseline_carbon_kg"],
-                    "avg_price": data["baseline_avg_price"],
-                    "avg_carbon": data["baseline_avg_carbon"],
-                },
-                "savings": {
-                    "cost": data["cost_savings"],
-                    "cost_percent": data["cost_savings_percent"],
-                    "carbon_kg": data["carbon_savings_kg"],
-                    "carbon_percent": data["carbon_savings_percent"],
-                },
-            },
-        },
+        "data": _schedule_data(_serialize_schedule_result(result)),
     }
 
 
-def _fleet_to_json(result: FleetOptimizationResult, command: str = "demo") -> dict:
+def _fleet_to_json(
+    result: FleetOptimizationResult,
+    command: str = "demo",
+    timestamp: str | None = None,
+) -> dict:
     """
     Convert FleetOptimizationResult to structured JSON format.
 
     Args:
         result: FleetOptimizationResult to convert
         command: Command that generated this result
+        timestamp: Export timestamp (ISO format); defaults to now
 
     Returns:
         Structured JSON dictionary
@@ -171,7 +336,7 @@ def _fleet_to_json(result: FleetOptimizationResult, command: str = "demo") -> di
 
     return {
         "command": command,
-        "timestamp": datetime.now().isoformat(),
+        "timestamp": timestamp or _export_timestamp(),
         "version": "0.1.0",
         "data": {
             "summary": {
@@ -182,104 +347,177 @@ def _fleet_to_json(result: FleetOptimizationResult, command: str = "demo") -> di
                 "average_carbon_savings_percent": data["average_carbon_savings_percent"],
                 "optimization_timestamp": data["optimization_timestamp"],
             },
-            "schedules": [
-                _schedule_to_json(result.schedules[i], command="optimize")["data"]
-                for i in range(len(result.schedules))
-            ],
+            "schedules": [_schedule_data(schedule) for schedule in data["schedules"]],
         },
     }
 
 
-def _schedule_to_csv_row(result: ScheduleResult, command: str = "optimize") -> dict:
+def _schedule_to_csv_row(
+    result: ScheduleResult,
+    command: str = "optimize",
+    timestamp: str | None = None,
+) -> tuple:
     """
     Flatten ScheduleResult to a single CSV row.
 
     Args:
         result: ScheduleResult to flatten
         command: Command that generated this result
+        timestamp: Export timestamp (ISO format); defaults to now
 
     Returns:
-        Dictionary with flattened column names and values
+        Row values in _SCHEDULE_CSV_FIELDS order
     """
-    data = _serialize_schedule_result(result)
-    workload = data["workload"]
+    workload = result.workload
+    cost_savings, carbon_kg, cost_percent, carbon_percent, delay_hours = _computed_metrics(result)
 
-    return {
-        "command": command,
-        "timestamp": datetime.now().isoformat(),
-        "version": "0.1.0",
+    return (
+        command,
+        timestamp or _export_timestamp(),
+        "0.1.0",
         # Workload fields
-        "workload_id": str(workload["id"]),
-        "workload_name": workload["name"],
-        "workload_duration_hours": workload["duration_hours"],
-        "workload_power_draw_kw": workload["power_draw_kw"],
-        "workload_energy_kwh": workload["energy_kwh"],
-        "workload_deadline_hours": workload["deadline_hours"],
-        "workload_type": workload["workload_type"],
-        "workload_priority": workload["priority"],
-        "workload_description": workload.get("description", ""),
+        str(workload.id),
+        workload.name,
+        workload.duration_hours,
+        workload.power_draw_kw,
+        workload.energy_kwh,
+        workload.deadline_hours,
+        workload.workload_type,
+        workload.priority,
+        workload.description,
         # Optimization fields
-        "optimal_start": data["optimal_start"],
-        "optimal_end": data["optimal_end"],
-        "baseline_start": data["baseline_start"],
-        "baseline_end": data["baseline_end"],
-        "delay_hours": data["delay_hours"],
+        result.optimal_start,
+        result.optimal_end,
+        result.baseline_start,
+        result.baseline_end,
+        delay_hours,
         # Optimized metrics
-        "optimized_cost": data["optimized_cost"],
-        "optimized_carbon_kg": data["optimized_carbon_kg"],
-        "optimized_avg_price": data["optimized_avg_price"],
-        "optimized_avg_carbon": data["optimized_avg_carbon"],
+        result.optimized_cost,
+        result.optimized_carbon_kg,
+        result.optimized_avg_price,
+        result.optimized_avg_carbon,
         # Baseline metrics
-        "baseline_cost": data["baseline_cost"],
-        "baseline_carbon_kg": data["baseline_carbon_kg"],
-        "baseline_avg_price": data["baseline_avg_price"],
-        "baseline_avg_carbon": data["baseline_avg_carbon"],
+        result.baseline_cost,
+        result.baseline_carbon_kg,
+        result.baseline_avg_price,
+        result.baseline_avg_carbon,
         # Savings (computed properties)
-        "cost_savings": data["cost_savings"],
-        "cost_savings_percent": data["cost_savings_percent"],
-        "carbon_savings_kg": data["carbon_savings_kg"],
-        "carbon_savings_percent": data["carbon_savings_percent"],
-    }
+        cost_savings,
+        cost_percent,
+        carbon_kg,
+        carbon_percent,
+    )
 
 
-def _fleet_to_csv_rows(result: FleetOptimizationResult, command: str = "demo") -> list[dict]:
+def _iter_fleet_csv_rows(
+    result: FleetOptimizationResult,
+    command: str = "demo",
+    timestamp: str | None = None,
+) -> Iterator[tuple]:
     """
-    Convert FleetOptimizationResult to CSV rows (summary + details).
+    Generate FleetOptimizationResult CSV rows (summary + details).
 
-    First row contains fleet summary, remaining rows contain individual schedules.
+    First row contains fleet summary, remaining rows contain individual
+    schedules. Rows are produced lazily so large fleets are written without
+    holding every row in memory.
 
     Args:
         result: FleetOptimizationResult to convert
         command: Command that generated this result
+        timestamp: Export timestamp (ISO format); shared by every row, defaults to now
 
-    Returns:
-        List of row dictionaries (first is summary, rest are details)
+    Yields:
+        Row tuples in _FLEET_CSV_FIELDS order (first is summary, rest are details)
     """
-    data = _serialize_fleet_result(result)
-    rows = []
+    timestamp = timestamp or _export_timestamp()
 
     # Summary row
-    summary_row = {
-        "record_type": "summary",
-        "command": command,
-        "timestamp": datetime.now().isoformat(),
-        "version": "0.1.0",
-        "fleet_total_workloads": data["total_workloads"],
-        "fleet_total_cost_savings": data["total_cost_savings"],
-        "fleet_total_carbon_savings_kg": data["total_carbon_savings_kg"],
-        "fleet_avg_cost_savings_percent": data["average_cost_savings_percent"],
-        "fleet_avg_carbon_savings_percent": data["average_carbon_savings_percent"],
-        "fleet_optimization_timestamp": data["optimization_timestamp"],
-    }
-    rows.append(summary_row)
+    yield (
+        "summary",
+        command,
+        timestamp,
+        "0.1.0",
+        result.total_workloads,
+        result.total_cost_savings,
+        result.total_carbon_savings_kg,
+        result.average_cost_savings_percent,
+        result.average_carbon_savings_percent,
+        result.optimization_timestamp,
+        *_FLEET_SUMMARY_PADDING,
+    )
 
     # Detail rows (individual schedules)
+    header_size = len(_CSV_HEADER_FIELDS)
     for schedule in result.schedules:
-        detail_row = {"record_type": "detail"}
-        detail_row.update(_schedule_to_csv_row(schedule, command="optimize"))
-        rows.append(detail_row)
+        row = _schedule_to_csv_row(schedule, "optimize", timestamp)
+        yield ("detail", *row[:header_size], *_FLEET_DETAIL_PADDING, *row[header_size:])
+
+
+def _forecast_to_json(
+    forecast_df: pd.DataFrame, region: str, hours: int, command: str = "forecast"
+) -> bytes:
+    """
+    Convert a forecast DataFrame to structured JSON text.
+
+    Rows are built from whole columns (one tolist() each) and encoded in one
+    pass by _dumps. Timestamps keep pandas' ISO format: millisecond
+    precision, converted to UTC with a "Z" suffix when timezone-aware.
+
+    Args:
+        forecast_df: Forecast DataFrame to convert
+        region: Grid region
+        hours: Number of forecast hours
+        command: Command that generated this result
+
+    Returns:
+        UTF-8 encoded JSON indented by two spaces
+    """
+    index = forecast_df.index
+    if isinstance(index, pd.DatetimeIndex):
+        suffix = ""
+        if index.tz is not None:
+            index, suffix = index.tz_convert(None), "Z"
+        stamps = np.datetime_as_string(index.to_numpy(), unit="ms")
+        index_values = [stamp + suffix for stamp in stamps.tolist()]
+    else:
+        index_values = index.tolist()
+    keys = [index.name or "index", *forecast_df.columns]
+    columns = [forecast_df[column].tolist() for column in forecast_df.columns]
+    records = [dict(zip(keys, row)) for row in zip(index_values, *columns)]
+    return _dumps(
+        {
+            "command": command,
+            "timestamp": _export_timestamp(),
+            "version": "0.1.0",
+            "metadata": {
+                "region": region,
+                "hours": hours,
+                "data_points": len(forecast_df),
+            },
+            "data": records,
+        }
+    )
 
-    return rows
+
+def _forecast_to_csv(forecast_df: pd.DataFrame) -> str:
+    """
+    Convert a forecast DataFrame to CSV text.
+
+    Forecast cells are numbers, timestamps and region codes, which never
+    need quoting, so pandas is asked to skip its quoting pass. Should a
+    cell ever contain a delimiter or quote, the csv module refuses to
+    write it unquoted and the default quoting is used instead.
+
+    Args:
+        forecast_df: Forecast DataFrame to convert
+
+    Returns:
+        CSV text with the timestamp index as the first column
+    """
+    try:
+        return forecast_df.to_csv(quoting=csv.QUOTE_NONE)
+    except csv.Error:
+        return forecast_df.to_csv()
 
 
 def export_schedule_result(
@@ -305,27 +543,26 @@ def export_schedule_result(
             # Export to stdout
             if format == ExportFormat.JSON:
                 json_data = _schedule_to_json(result, command)
-                json.dump(json_data, sys.stdout, indent=2, default=str)
+                sys.stdout.write(_dumps(json_data).decode())
                 sys.stdout.write("\n")
             elif format == ExportFormat.CSV:
                 csv_row = _schedule_to_csv_row(result, command)
-                writer = csv.DictWriter(sys.stdout, fieldnames=csv_row.keys())
-                writer.writeheader()
+                writer = csv.writer(sys.stdout)
+                writer.writerow(_SCHEDULE_CSV_FIELDS)
                 writer.writerow(csv_row)
         else:
             # Export to file
             output_path = Path(output)
-            output_path.parent.mkdir(parents=True, exist_ok=True)
 
             if format == ExportFormat.JSON:
                 json_data = _schedule_to_json(result, command)
-                with open(output_path, "w") as f:
-                    json.dump(json_data, f, indent=2, default=str)
+                with _open_output(output_path, "wb") as f:
+                    f.write(_dumps(json_data))
             elif format == ExportFormat.CSV:
                 csv_row = _schedule_to_csv_row(result, command)
-                with open(output_path, "w", newline="") as f:
-                    writer = csv.DictWriter(f, fieldnames=csv_row.keys())
-                    writer.writeheader()
+                with _open_output(output_path, "w", newline="") as f:
+                    writer = csv.writer(f)
+                    writer.writerow(_SCHEDULE_CSV_FIELDS)
                     writer.writerow(csv_row)
 
     except PermissionError as e:
@@ -359,44 +596,29 @@ def export_fleet_result(
             # Export to stdout
             if format == ExportFormat.JSON:
                 json_data = _fleet_to_json(result, command)
-                json.dump(json_data, sys.stdout, indent=2, default=str)
+                sys.stdout.write(_dumps(json_data).decode())
                 sys.stdout.write("\n")
             elif format == ExportFormat.CSV:
-                rows = _fleet_to_csv_rows(result, command)
-                # Get all unique fieldnames from all rows
-                fieldnames = []
-                for row in rows:
-                    for key in row.keys():
-                        if key not in fieldnames:
-                            fieldnames.append(key)
-
-                writer = csv.DictWriter(sys.stdout, fieldnames=fieldnames)
-                writer.writeheader()
-                for row in rows:
-                    writer.writerow(row)
+                rows = _iter_fleet_csv_rows(result, command)
+
+                writer = csv.writer(sys.stdout)
+                writer.writerow(_FLEET_CSV_FIELDS)
+                writer.writerows(rows)
         else:
             # Export to file
             output_path = Path(output)
-            output_path.parent.mkdir(parents=True, exist_ok=True)
 
             if format == ExportFormat.JSON:
                 json_data = _fleet_to_json(result, command)
-                with open(output_path, "w") as f:
-                    json.dump(json_data, f, indent=2, default=str)
+                with _open_output(output_path, "wb") as f:
+                    f.write(_dumps(json_data))
             elif format == ExportFormat.CSV:
-                rows = _fleet_to_csv_rows(result, command)
-                # Get all unique fieldnames from all rows
-                fieldnames = []
-                for row in rows:
-                    for key in row.keys():
-                        if key not in fieldnames:
-                            fieldnames.append(key)
-
-                with open(output_path, "w", newline="") as f:
-                    writer = csv.DictWriter(f, fieldnames=fieldnames)
-                    writer.writeheader()
-                    for row in rows:
-                        writer.writerow(row)
+                rows = _iter_fleet_csv_rows(result, command)
+
+                with _open_output(output_path, "w", newline="", buffering=WRITE_BUFFER_SIZE) as f:
+                    writer = csv.writer(f)
+                    writer.writerow(_FLEET_CSV_FIELDS)
+                    writer.writerows(rows)
 
     except PermissionError as e:
         raise ExportError(f"Permission denied writing to {output}: {e}")
@@ -430,38 +652,25 @@ def export_forecast(
     """
     try:
         if format == ExportFormat.JSON:
-            # Convert DataFrame to structured JSON with metadata
-            json_data = {
-                "command": command,
-                "timestamp": datetime.now().isoformat(),
-                "version": "0.1.0",
-                "metadata": {
-                    "region": region,
-                    "hours": hours,
-                    "data_points": len(forecast_df),
-                },
-                "data": json.loads(
-                    forecast_df.reset_index().to_json(orient="records", date_format="iso")
-                ),
-            }
+            payload = _forecast_to_json(forecast_df, region, hours, command)
 
             if str(output) == "-":
-                json.dump(json_data, sys.stdout, indent=2, default=str)
+                sys.stdout.write(payload.decode())
                 sys.stdout.write("\n")
             else:
                 output_path = Path(output)
-                output_path.parent.mkdir(parents=True, exist_ok=True)
-                with open(output_path, "w") as f:
-                    json.dump(json_data, f, indent=2, default=str)
+                with _open_output(output_path, "wb") as f:
+                    f.write(payload)
 
         elif format == ExportFormat.CSV:
-            # Export DataFrame directly to CSV
+            csv_text = _forecast_to_csv(forecast_df)
+
             if str(output) == "-":
-                forecast_df.to_csv(sys.stdout)
+                sys.stdout.write(csv_text)
             else:
                 output_path = Path(output)
-                output_path.parent.mkdir(parents=True, exist_ok=True)
-                forecast_df.to_csv(output_path)
+                with _open_output(output_path, "w", encoding="utf-8", newline="") as f:
+                    f.write(csv_text)
 
     except PermissionError as e:
         raise ExportError(f"Permission denied writing to {output}: {e}")
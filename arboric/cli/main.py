@@ -6,12 +6,14 @@ for cost and carbon optimization. Built with Typer and Rich.
 """
 
 import time
+from concurrent.futures import Future, ThreadPoolExecutor, wait
 from datetime import datetime
+from typing import TYPE_CHECKING, Any
 
 import typer
 from rich import box
 from rich.align import Align
-from rich.console import Console
+from rich.console import Console, Group
 from rich.panel import Panel
 from rich.progress import (
     BarColumn,
@@ -21,14 +23,19 @@ from rich.progress import (
     TextColumn,
     TimeElapsedColumn,
 )
-from rich.table import Table
-from rich.text import Text
+from rich.style import Style
+from rich.table import Column, Table
+from rich.text import Span, Text
 
-from arboric.core.autopilot import Autopilot, OptimizationConfig
 from arboric.core.config import ArboricConfig, get_config
-from arboric.core.grid_oracle import MockGrid, get_grid
-from arboric.core.history import HistoryStore
-from arboric.core.models import FleetOptimizationResult, Workload, WorkloadType
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+    from arboric.cli.export import ExportFormat
+    from arboric.core.autopilot import Autopilot
+    from arboric.core.grid_oracle import MockGrid
+    from arboric.core.models import ScheduleResult
 
 # Initialize Rich console
 console = Console()
@@ -115,10 +122,22 @@ ARBORIC_AMBER = "#f59e0b"
 ARBORIC_RED = "#ef4444"
 ARBORIC_PURPLE = "#8b5cf6"
 
+# Pre-parsed styles for per-row colored cells (Text objects skip markup parsing)
+_GREEN = Style(color=ARBORIC_GREEN)
+_AMBER = Style(color=ARBORIC_AMBER)
+_RED = Style(color=ARBORIC_RED)
+_BOLD = Style(bold=True)
+_LEVEL_STYLES = (_GREEN, _AMBER, _RED)  # good / moderate / poor
 
-def print_banner():
-    """Display the Arboric ASCII banner."""
-    banner = """
+
+def _styled(text: str, style: Style) -> Text:
+    """Text styled like "[style]text[/style]" markup, without the markup parser."""
+    return Text(text, spans=[Span(0, len(text), style)])
+
+
+# Static renderables are built once at import; commands only fill in rows.
+_BANNER = Text(
+    """
     ╔═══════════════════════════════════════════════════════════════╗
     ║                                                               ║
     ║     █████╗ ██████╗ ██████╗  ██████╗ ██████╗ ██╗ ██████╗       ║
@@ -131,13 +150,103 @@ def print_banner():
     ║           Intelligent Autopilot for Cloud Infrastructure      ║
     ║                  Harvest Optimal Energy Windows               ║
     ╚═══════════════════════════════════════════════════════════════╝
-    """
-    console.print(banner, style=f"bold {ARBORIC_GREEN}")
+    """,
+    style=f"bold {ARBORIC_GREEN}",
+)
+
+_COMPARISON_COLUMNS = (
+    Column("Metric", style="bold white", width=20),
+    Column("Immediate Run", style=f"bold {ARBORIC_RED}", justify="right", width=18),
+    Column("Arboric Schedule", style=f"bold {ARBORIC_GREEN}", justify="right", width=18),
+    Column("Yield", style=f"bold {ARBORIC_AMBER}", justify="right", width=14),
+)
+
+_REGION_COLUMNS = (
+    Column("Region", style="bold white", width=15),
+    Column("Best Window", style="white", width=12),
+    Column("Spot Rate", style="white", justify="right", width=12),
+    Column("Carbon", style="white", justify="right", width=14),
+    Column("Cost", style="white", justify="right", width=10),
+    Column("You Save", style=f"bold {ARBORIC_GREEN}", justify="right", width=12),
+)
+
+_TRADEOFF_COLUMNS = (
+    Column("#", style="dim", width=3),
+    Column("Schedule Time", justify="center", width=16),
+    Column("Cost", justify="right", width=12, style=ARBORIC_AMBER),
+    Column("Carbon (kg)", justify="right", width=14, style=ARBORIC_GREEN),
+    Column("Cost Saved", justify="right", width=12),
+    Column("Carbon Saved", justify="right", width=14),
+)
+
+_QUEUE_COLUMNS = (
+    Column("#", style="dim", width=3),
+    Column("Workload", style="white", width=30),
+    Column("Duration", justify="right", width=10),
+    Column("Power", justify="right", width=10),
+    Column("Energy", justify="right", width=12),
+    Column("Deadline", justify="right", width=10),
+)
+
+_RESULTS_COLUMNS = (
+    Column("Workload", style="white", width=36, no_wrap=True),
+    Column("Scheduled", justify="center", width=10),
+    Column("Delay", justify="right", width=10),
+    Column("Cost Saved", justify="right", width=12),
+    Column("CO₂ Saved", justify="right", width=12, style=ARBORIC_GREEN),
+)
+
+_FORECAST_COLUMNS = (
+    Column("Time", style="white", width=8),
+    Column("Price", justify="right", width=12),
+    Column("Carbon", justify="right", width=14),
+    Column("Renewable", justify="right", width=12),
+    Column("Status", justify="center", width=20),
+)
+
+_STATUS_COLUMNS = (
+    Column("Component", style="white", width=25),
+    Column("Status", justify="center", width=15),
+    Column("Details", width=35),
+)
+
+
+# demo() impact report; brand colors are fixed, the fleet figures fill the fields
+_IMPACT_TEMPLATE = "\n".join(
+    [
+        f"[bold {ARBORIC_GREEN}]ARBORIC IMPACT REPORT[/bold {ARBORIC_GREEN}]",
+        "",
+        "[bold]Fleet Optimization Summary[/bold]",
+        "Workloads Processed:  [bold]{workloads}[/bold]",
+        "Total Energy:         [bold]{total_energy:,.0f} kWh[/bold]",
+        "",
+        f"[bold {ARBORIC_RED}]Without Arboric[/bold {ARBORIC_RED}]        [bold {ARBORIC_GREEN}]With Arboric[/bold {ARBORIC_GREEN}]",
+        "Cost:    ${baseline_cost:>8,.2f}         Cost:    ${optimized_cost:>8,.2f}",
+        "Carbon:  {baseline_carbon:>8,.2f} kg       Carbon:  {optimized_carbon:>8,.2f} kg",
+        "",
+        "[bold {cost_color}]💰 COST {cost_label}:  ${cost_saved:>8,.2f}  ({cost_pct:.1f}% {saved_label})[/bold {cost_color}]",
+        f"[bold {ARBORIC_GREEN}]🌱 CARBON AVOIDED:  {{carbon_saved:>8,.2f}} kg ({{carbon_pct:.1f}}% reduction)[/bold {ARBORIC_GREEN}]",
+        "",
+        "[bold {cost_color}]💵 ANNUALIZED SAVINGS: ${annual_cost:>,.0f}/year[/bold {cost_color}]",
+        "[dim]🌲 {annual_carbon_tons:,.1f} metric tons CO₂ avoided per year[/dim]",
+    ]
+)
+
+
+def _new_table(columns: tuple[Column, ...], **kwargs: Any) -> Table:
+    """Create a Table from prebuilt column specs (each call gets fresh copies)."""
+    return Table(*(column.copy() for column in columns), **kwargs)
+
+
+def print_banner():
+    """Display the Arboric ASCII banner."""
+    console.print(_BANNER)
 
 
 def create_comparison_table(result) -> Table:
     """Create a visual comparison table for optimization results."""
-    table = Table(
+    table = _new_table(
+        _COMPARISON_COLUMNS,
         title="",
         box=box.ROUNDED,
         show_header=True,
@@ -146,11 +255,6 @@ def create_comparison_table(result) -> Table:
         padding=(0, 1),
     )
 
-    table.add_column("Metric", style="bold white", width=20)
-    table.add_column("Immediate Run", style=f"bold {ARBORIC_RED}", justify="right", width=18)
-    table.add_column("Arboric Schedule", style=f"bold {ARBORIC_GREEN}", justify="right", width=18)
-    table.add_column("Yield", style=f"bold {ARBORIC_AMBER}", justify="right", width=14)
-
     # Start time
     if result.delay_hours > 0:
         optimal_col = f"{result.optimal_start_clock} (+{result.delay_hours:.1f}h)"
@@ -214,43 +318,30 @@ def create_comparison_table(result) -> Table:
 
 def create_forecast_chart(forecast_df, optimal_start, workload_duration) -> str:
     """Create an ASCII visualization of the forecast with scheduled window."""
+    import numpy as np
+
     hours = min(24, len(forecast_df))
+    height = 8
 
     # Normalize values for display
-    prices = forecast_df["price"].head(hours).values
-    carbons = forecast_df["co2_intensity"].head(hours).values
-
+    prices = forecast_df["price"].to_numpy()[:hours]
     price_min, price_max = prices.min(), prices.max()
-    _carbon_min, _carbon_max = carbons.min(), carbons.max()
+    if price_max == price_min:
+        bar_heights = np.full(hours, height // 2)
+    else:
+        bar_heights = ((prices - price_min) / (price_max - price_min) * (height - 1)).astype(int)
 
-    def normalize(val, vmin, vmax, height=8):
-        if vmax == vmin:
-            return height // 2
-        return int((val - vmin) / (vmax - vmin) * (height - 1))
+    # Hours inside the scheduled window
+    offsets = (forecast_df.index[:hours] - optimal_start).total_seconds().to_numpy() / 3600
+    in_window = (offsets >= 0) & (offsets < workload_duration)
 
-    # Build chart
-    lines = []
-    height = 8
+    # One character per (chart row, hour): scheduled window, other bar, or blank
+    filled = bar_heights >= np.arange(height - 1, -1, -1)[:, None]
+    cells = np.where(filled, np.where(in_window, "█", "▒"), " ")
 
-    # Price chart
-    lines.append(f"  {'Price ($/hr)':<20} │ ${price_max:.2f}")
-    for row in range(height - 1, -1, -1):
-        line = "  " + " " * 20 + " │ "
-        for i, price in enumerate(prices):
-            h = normalize(price, price_min, price_max, height)
-            if h >= row:
-                # Check if this hour is in the optimal window
-                hour_ts = forecast_df.index[i]
-                if (
-                    hour_ts >= optimal_start
-                    and (hour_ts - optimal_start).total_seconds() / 3600 < workload_duration
-                ):
-                    line += "█"  # Scheduled window
-                else:
-                    line += "▒"
-            else:
-                line += " "
-        lines.append(line)
+    # Build chart
+    lines = [f"  {'Price ($/hr)':<20} │ ${price_max:.2f}"]
+    lines.extend("  " + " " * 20 + " │ " + "".join(row) for row in cells)
     lines.append(f"  {'':20} │ ${price_min:.2f}")
     lines.append(f"  {'':20} └{'─' * hours}")
 
@@ -265,8 +356,10 @@ def create_forecast_chart(forecast_df, optimal_start, workload_duration) -> str:
     return "\n".join(lines)
 
 
-def simulate_optimization_animation(workload_name: str, duration: float = 1.5):
-    """Display animated optimization process."""
+def simulate_optimization_animation(
+    workload_name: str, duration: float = 1.5, until: Future | None = None
+):
+    """Display animated optimization process, ending early once `until` completes."""
     steps = [
         ("Connecting to Grid Oracle...", 0.2),
         ("Fetching 24h forecast data...", 0.3),
@@ -288,17 +381,65 @@ def simulate_optimization_animation(workload_name: str, duration: float = 1.5):
 
         for step_text, step_time in steps:
             progress.update(task, description=f"[white]{step_text}")
-            time.sleep(step_time * (duration / 1.5))
+            delay = step_time * (duration / 1.5)
+            if until is None:
+                time.sleep(delay)
+            elif wait([until], timeout=delay).done:
+                final_text = steps[-1][0]
+                progress.update(task, description=f"[white]{final_text}", completed=len(steps))
+                break
             progress.advance(task)
 
 
+def _should_animate(animate: bool | None, output: str | None = None) -> bool:
+    """Resolve --animate/--no-animate: off when exporting, else default to TTY detection."""
+    if output:
+        return False
+    return console.is_terminal if animate is None else animate
+
+
+def _resolve_export_format(output: str, format: str | None) -> "ExportFormat":
+    """
+    Pick the export format from --format, or from the output file extension.
+
+    Args:
+        output: Output file path (or '-' for stdout)
+        format: Value of the --format option, if given
+
+    Returns:
+        ExportFormat to write
+
+    Raises:
+        typer.Exit: If the format is invalid or cannot be detected
+    """
+    from arboric.cli.export import ExportFormat, detect_format
+
+    if format:
+        try:
+            return ExportFormat(format.lower())
+        except ValueError:
+            console.print(
+                f"[{ARBORIC_RED}]Invalid format '{format}'. Use 'json' or 'csv'.[/{ARBORIC_RED}]"
+            )
+            raise typer.Exit(1)
+
+    export_format = detect_format(output)
+    if not export_format:
+        console.print(
+            f"[{ARBORIC_RED}]Cannot detect format from '{output}'. Use --format flag.[/{ARBORIC_RED}]"
+        )
+        raise typer.Exit(1)
+    return export_format
+
+
 def _display_region_comparison(comparison, frequency: str | None = None, quiet: bool = False):
     """Display cross-region temporal comparison results."""
     if quiet:
         return
 
     # Create comparison table
-    table = Table(
+    table = _new_table(
+        _REGION_COLUMNS,
         title="",
         box=box.ROUNDED,
         show_header=True,
@@ -307,13 +448,6 @@ def _display_region_comparison(comparison, frequency: str | None = None, quiet:
         padding=(0, 1),
     )
 
-    table.add_column("Region", style="bold white", width=15)
-    table.add_column("Best Window", style="white", width=12)
-    table.add_column("Spot Rate", style="white", justify="right", width=12)
-    table.add_column("Carbon", style="white", justify="right", width=14)
-    table.add_column("Cost", style="white", justify="right", width=10)
-    table.add_column("You Save", style=f"bold {ARBORIC_GREEN}", justify="right", width=12)
-
     # Add entries (already sorted cheapest-first)
     for entry in comparison.entries:
         region_label = entry.region
@@ -399,10 +533,20 @@ def optimize(
         hidden=True,
     ),
     quiet: bool = typer.Option(False, "--quiet", "-q", help="Minimal output"),
+    animate: bool | None = typer.Option(
+        None,
+        "--animate/--no-animate",
+        help="Show progress animations (default: on in a terminal, off when exporting)",
+    ),
     output: str | None = typer.Option(
         None, "--output", "-o", help="Output file path (or '-' for stdout)"
     ),
     format: str | None = typer.Option(None, "--format", help="Export format: json, csv"),
+    display: bool = typer.Option(
+        True,
+        "--display/--no-display",
+        help="Render results in the terminal (--no-display with --output only writes the export)",
+    ),
     receipt: str | None = typer.Option(
         None, "--receipt", help="Generate certified receipt PDF at path"
     ),
@@ -417,6 +561,11 @@ def optimize(
     Power draw is auto-derived from the instance type if provided, or defaults to 100 kW.
     If options are not specified, values from ~/.arboric/config.yaml will be used.
     """
+    from arboric.core.autopilot import Autopilot, OptimizationConfig
+    from arboric.core.grid_oracle import get_grid
+    from arboric.core.history import HistoryStore
+    from arboric.core.models import Workload, WorkloadType
+
     # Load configuration for defaults
     cfg = get_config()
 
@@ -432,7 +581,8 @@ def optimize(
     region = region if region is not None else cfg.defaults.region
     instance_type = instance_type if instance_type is not None else cfg.defaults.instance_type
     cloud_provider = cloud_provider if cloud_provider is not None else cfg.defaults.cloud_provider
-    quiet = quiet or cfg.cli.quiet_mode
+    show = display or not output
+    quiet = quiet or cfg.cli.quiet_mode or not show
 
     # Normalize legacy region aliases to Azure ARM IDs
     _region_aliases = {
@@ -472,10 +622,11 @@ def optimize(
         region = best_region  # Set region for normal flow
 
         # Display which region was chosen
-        console.print(
-            f"[bold {ARBORIC_GREEN}]✓ Optimal region across all: {best_region}[/bold {ARBORIC_GREEN}]"
-        )
-        console.print()
+        if show:
+            console.print(
+                f"[bold {ARBORIC_GREEN}]✓ Optimal region across all: {best_region}[/bold {ARBORIC_GREEN}]"
+            )
+            console.print()
 
     # Create workload
     workload = Workload(
@@ -518,46 +669,54 @@ def optimize(
         border_style=ARBORIC_PURPLE,
         padding=(1, 2),
     )
-    console.print(workload_panel)
-    console.print()
-
-    # Simulate optimization
-    if not quiet:
-        simulate_optimization_animation(workload_name)
+    if show:
+        console.print(workload_panel)
         console.print()
 
     # Get forecast and optimize
-    grid = get_grid(
-        region=region,
-        config=cfg,
-        instance_type=instance_type,
-        cloud_provider=cloud_provider,
-    )
-    # Pass appropriate time based on grid type:
-    # - MockGrid expects naive local time for correct hour_of_day calculations
-    # - LiveGrid expects UTC time (interprets naive datetime as UTC)
-    from datetime import timezone as tz
+    def fetch_and_optimize() -> tuple["MockGrid", "pd.DataFrame", "Autopilot", "ScheduleResult"]:
+        grid = get_grid(
+            region=region,
+            config=cfg,
+            instance_type=instance_type,
+            cloud_provider=cloud_provider,
+        )
+        # Pass appropriate time based on grid type:
+        # - MockGrid expects naive local time for correct hour_of_day calculations
+        # - LiveGrid expects UTC time (interprets naive datetime as UTC)
+        from datetime import timezone as tz
+
+        now_local = datetime.now().replace(minute=0, second=0, microsecond=0)
+        if getattr(grid, "is_live", False):
+            # Live grid interprets naive datetime as UTC
+            now_for_forecast = now_local.astimezone(tz.utc).replace(tzinfo=None)
+        else:
+            # MockGrid expects naive local time
+            now_for_forecast = now_local
+        forecast = grid.get_forecast(
+            hours=int(deadline) + int(duration) + 2, start_time=now_for_forecast
+        )
 
-    now_local = datetime.now().replace(minute=0, second=0, microsecond=0)
-    if getattr(grid, "is_live", False):
-        # Live grid interprets naive datetime as UTC
-        now_for_forecast = now_local.astimezone(tz.utc).replace(tzinfo=None)
+        # Create autopilot with config-based optimization settings
+        opt_config = OptimizationConfig(
+            cost_weight=cfg.optimization.cost_weight,
+            carbon_weight=cfg.optimization.carbon_weight,
+            min_delay_hours=cfg.optimization.min_delay_hours,
+            prefer_continuous=cfg.optimization.prefer_continuous,
+        )
+        autopilot = Autopilot(config=opt_config)
+        result = autopilot.optimize_schedule(workload, forecast)
+        return grid, forecast, autopilot, result
+
+    # Run the real work behind the animation; the animation stops when it finishes
+    if not quiet and _should_animate(animate, output):
+        with ThreadPoolExecutor(max_workers=1) as pool:
+            job = pool.submit(fetch_and_optimize)
+            simulate_optimization_animation(workload_name, until=job)
+        console.print()
+        grid, forecast, autopilot, result = job.result()
     else:
-        # MockGrid expects naive local time
-        now_for_forecast = now_local
-    forecast = grid.get_forecast(
-        hours=int(deadline) + int(duration) + 2, start_time=now_for_forecast
-    )
-
-    # Create autopilot with config-based optimization settings
-    opt_config = OptimizationConfig(
-        cost_weight=cfg.optimization.cost_weight,
-        carbon_weight=cfg.optimization.carbon_weight,
-        min_delay_hours=cfg.optimization.min_delay_hours,
-        prefer_continuous=cfg.optimization.prefer_continuous,
-    )
-    autopilot = Autopilot(config=opt_config)
-    result = autopilot.optimize_schedule(workload, forecast)
+        grid, forecast, autopilot, result = fetch_and_optimize()
 
     # DEBUG: Print autopilot logs
     if not quiet:
@@ -579,29 +738,9 @@ def optimize(
 
     # Handle export if requested
     if output:
-        from arboric.cli.export import (
-            ExportError,
-            ExportFormat,
-            detect_format,
-            export_schedule_result,
-        )
+        from arboric.cli.export import ExportError, export_schedule_result
 
-        # Determine format
-        if format:
-            try:
-                export_format = ExportFormat(format.lower())
-            except ValueError:
-                console.print(
-                    f"[{ARBORIC_RED}]Invalid format '{format}'. Use 'json' or 'csv'.[/{ARBORIC_RED}]"
-                )
-                raise typer.Exit(1)
-        else:
-            export_format = detect_format(output)
-            if not export_format:
-                console.print(
-                    f"[{ARBORIC_RED}]Cannot detect format from '{output}'. Use --format flag.[/{ARBORIC_RED}]"
-                )
-                raise typer.Exit(1)
+        export_format = _resolve_export_format(output, format)
 
         # Export
         try:
@@ -635,6 +774,9 @@ def optimize(
             console.print(f"[{ARBORIC_RED}]Receipt generation failed: {e}[/{ARBORIC_RED}]")
             raise typer.Exit(1)
 
+    if not show:
+        return
+
     # Display events
     events = grid.detect_events(forecast)
     if events and not quiet:
@@ -718,6 +860,11 @@ def tradeoff(
     ),
     points: int = typer.Option(10, "--points", "-n", help="Number of tradeoff points to show"),
     quiet: bool = typer.Option(False, "--quiet", "-q", help="Minimal output"),
+    animate: bool | None = typer.Option(
+        None,
+        "--animate/--no-animate",
+        help="Show progress animations (default: on in a terminal, off when exporting)",
+    ),
 ):
     """
     Analyze cost/carbon tradeoff frontier for a workload.
@@ -729,6 +876,10 @@ def tradeoff(
 
     If options are not specified, values from ~/.arboric/config.yaml will be used.
     """
+    from arboric.core.autopilot import Autopilot, OptimizationConfig
+    from arboric.core.grid_oracle import get_grid
+    from arboric.core.models import Workload, WorkloadType
+
     cfg = get_config()
 
     duration = duration if duration is not None else cfg.defaults.duration_hours
@@ -775,7 +926,7 @@ def tradeoff(
     console.print(workload_panel)
     console.print()
 
-    if not quiet:
+    if not quiet and _should_animate(animate):
         simulate_optimization_animation(workload_name, duration=1.0)
         console.print()
 
@@ -812,27 +963,22 @@ def tradeoff(
 
     tradeoff_points = autopilot.generate_tradeoff_frontier(workload, forecast, num_points=points)
 
-    tradeoff_table = Table(
+    tradeoff_table = _new_table(
+        _TRADEOFF_COLUMNS,
         title="[bold]Cost/Carbon Tradeoff Frontier",
         box=box.ROUNDED,
         border_style=ARBORIC_BLUE,
         header_style=f"bold {ARBORIC_BLUE}",
     )
-    tradeoff_table.add_column("#", style="dim", width=3)
-    tradeoff_table.add_column("Schedule Time", justify="center", width=16)
-    tradeoff_table.add_column("Cost", justify="right", width=12, style=ARBORIC_AMBER)
-    tradeoff_table.add_column("Carbon (kg)", justify="right", width=14, style=ARBORIC_GREEN)
-    tradeoff_table.add_column("Cost Saved", justify="right", width=12)
-    tradeoff_table.add_column("Carbon Saved", justify="right", width=14)
 
     for i, point in enumerate(tradeoff_points, 1):
-        cost_color = ARBORIC_GREEN if point["cost_savings"] >= 0 else ARBORIC_AMBER
-        cost_display = f"[{cost_color}]${point['cost']:.2f}[/{cost_color}]"
-        savings_display = (
-            f"[{ARBORIC_GREEN}]${point['cost_savings']:.2f}[/{ARBORIC_GREEN}]"
-            if point["cost_savings"] >= 0
-            else f"[{ARBORIC_AMBER}]-${abs(point['cost_savings']):.2f}[/{ARBORIC_AMBER}]"
-        )
+        if point["cost_savings"] >= 0:
+            cost_style = _GREEN
+            savings_display = _styled(f"${point['cost_savings']:.2f}", _GREEN)
+        else:
+            cost_style = _AMBER
+            savings_display = _styled(f"-${abs(point['cost_savings']):.2f}", _AMBER)
+        cost_display = _styled(f"${point['cost']:.2f}", cost_style)
 
         tradeoff_table.add_row(
             str(i),
@@ -865,6 +1011,16 @@ def demo(
         None, "--output", "-o", help="Output file path (or '-' for stdout)"
     ),
     format: str | None = typer.Option(None, "--format", "-f", help="Export format: json, csv"),
+    display: bool = typer.Option(
+        True,
+        "--display/--no-display",
+        help="Render results in the terminal (--no-display with --output only writes the export)",
+    ),
+    animate: bool | None = typer.Option(
+        None,
+        "--animate/--no-animate",
+        help="Show progress animations (default: on in a terminal, off when exporting)",
+    ),
 ):
     """
     Run the Arboric Autopilot demo with multiple AI workloads.
@@ -874,8 +1030,12 @@ def demo(
 
     Export results: arboric demo --output fleet.json
     """
-    print_banner()
-    console.print()
+    from arboric.core.autopilot import Autopilot
+    from arboric.core.grid_oracle import MockGrid
+    from arboric.core.models import FleetOptimizationResult, Workload, WorkloadType
+
+    show = display or not output
+    animate = _should_animate(animate, output)
 
     # Demo workloads (realistic AI/data pipeline jobs)
     demo_workloads = [
@@ -916,47 +1076,46 @@ def demo(
         ),
     ]
 
-    # Display intro
-    intro_panel = Panel(
-        f"""[bold]Arboric Autopilot Demo[/bold]
+    if show:
+        print_banner()
+        console.print()
+
+        # Display intro
+        intro_panel = Panel(
+            f"""[bold]Arboric Autopilot Demo[/bold]
 
 Simulating intelligent scheduling for [bold]{len(demo_workloads)}[/bold] heavy compute workloads.
 The autopilot will analyze grid conditions and optimize each job for
 minimum cost and carbon emissions.
 
 [dim]Region: eastus  |  Forecast Horizon: 24h  |  Optimization: 70% cost / 30% carbon[/dim]""",
-        border_style=ARBORIC_PURPLE,
-        padding=(1, 2),
-    )
-    console.print(intro_panel)
-    console.print()
+            border_style=ARBORIC_PURPLE,
+            padding=(1, 2),
+        )
+        console.print(intro_panel)
+        console.print()
 
-    # Show workload queue
-    queue_table = Table(
-        title="[bold]Workload Queue",
-        box=box.ROUNDED,
-        border_style=ARBORIC_BLUE,
-        header_style=f"bold {ARBORIC_BLUE}",
-    )
-    queue_table.add_column("#", style="dim", width=3)
-    queue_table.add_column("Workload", style="white", width=30)
-    queue_table.add_column("Duration", justify="right", width=10)
-    queue_table.add_column("Power", justify="right", width=10)
-    queue_table.add_column("Energy", justify="right", width=12)
-    queue_table.add_column("Deadline", justify="right", width=10)
-
-    for i, w in enumerate(demo_workloads, 1):
-        queue_table.add_row(
-            str(i),
-            w.name,
-            f"{w.duration_hours}h",
-            f"{w.power_draw_kw} kW",
-            f"{w.energy_kwh} kWh",
-            f"{w.deadline_hours}h",
+        # Show workload queue
+        queue_table = _new_table(
+            _QUEUE_COLUMNS,
+            title="[bold]Workload Queue",
+            box=box.ROUNDED,
+            border_style=ARBORIC_BLUE,
+            header_style=f"bold {ARBORIC_BLUE}",
         )
 
-    console.print(queue_table)
-    console.print()
+        for i, w in enumerate(demo_workloads, 1):
+            queue_table.add_row(
+                str(i),
+                w.name,
+                f"{w.duration_hours}h",
+                f"{w.power_draw_kw} kW",
+                f"{w.energy_kwh} kWh",
+                f"{w.deadline_hours}h",
+            )
+
+        console.print(queue_table)
+        console.print()
 
     # Initialize grid and autopilot
     # Start forecast at evening peak (18:00) to show optimizer finding cheaper morning windows
@@ -967,11 +1126,13 @@ minimum cost and carbon emissions.
     forecast = grid.get_forecast(hours=48, start_time=demo_start)  # Extended forecast
     autopilot = Autopilot()
 
-    # Process each workload with live updates
-    results = []
+    # The demo workloads are independent, so one fleet pass schedules them all
+    # against a single prepared forecast; the progress bar below replays them
+    results = autopilot.optimize_fleet(demo_workloads, forecast).schedules
 
-    console.print(f"[bold {ARBORIC_GREEN}]Engaging Autopilot...[/bold {ARBORIC_GREEN}]")
-    console.print()
+    if show:
+        console.print(f"[bold {ARBORIC_GREEN}]Engaging Autopilot...[/bold {ARBORIC_GREEN}]")
+        console.print()
 
     with Progress(
         SpinnerColumn(spinner_name="dots", style=ARBORIC_GREEN),
@@ -980,6 +1141,8 @@ minimum cost and carbon emissions.
         TaskProgressColumn(),
         TimeElapsedColumn(),
         console=console,
+        # A redirected stream gets no live bar (and no refresh thread)
+        disable=not (show and console.is_terminal),
     ) as progress:
         main_task = progress.add_task(
             "[white]Processing workload queue...",
@@ -990,48 +1153,41 @@ minimum cost and carbon emissions.
             progress.update(main_task, description=f"[white]Optimizing: {workload.name}")
 
             # Simulate processing time
-            time.sleep(0.8)
-
-            # Get optimization result
-            result = autopilot.optimize_schedule(workload, forecast)
-            results.append(result)
+            if animate:
+                time.sleep(0.8)
 
             progress.advance(main_task)
 
-    console.print()
+    if show:
+        console.print()
 
-    # Calculate totals for fleet result
-    total_cost_saved_calc = sum(r.cost_savings for r in results)
-    total_carbon_saved_calc = sum(r.carbon_savings_kg for r in results)
+    # Fleet totals for the export, results table and impact report (one pass)
+    total_cost_saved = total_carbon_saved = 0.0
+    total_baseline_cost = total_optimized_cost = 0.0
+    total_baseline_carbon = total_optimized_carbon = 0.0
+    total_energy = 0.0
+    for r in results:
+        total_cost_saved += r.cost_savings
+        total_carbon_saved += r.carbon_savings_kg
+        total_baseline_cost += r.baseline_cost
+        total_optimized_cost += r.optimized_cost
+        total_baseline_carbon += r.baseline_carbon_kg
+        total_optimized_carbon += r.optimized_carbon_kg
+        total_energy += r.workload.energy_kwh
 
     # Create FleetOptimizationResult for export
     fleet_result = FleetOptimizationResult(
         schedules=results,
-        total_cost_savings=total_cost_saved_calc,
-        total_carbon_savings_kg=total_carbon_saved_calc,
+        total_cost_savings=total_cost_saved,
+        total_carbon_savings_kg=total_carbon_saved,
         total_workloads=len(results),
     )
 
     # Handle export if requested
     if output:
-        from arboric.cli.export import ExportError, ExportFormat, detect_format, export_fleet_result
+        from arboric.cli.export import ExportError, export_fleet_result
 
-        # Determine format
-        if format:
-            try:
-                export_format = ExportFormat(format.lower())
-            except ValueError:
-                console.print(
-                    f"[{ARBORIC_RED}]Invalid format '{format}'. Use 'json' or 'csv'.[/{ARBORIC_RED}]"
-                )
-                raise typer.Exit(1)
-        else:
-            export_format = detect_format(output)
-            if not export_format:
-                console.print(
-                    f"[{ARBORIC_RED}]Cannot detect format from '{output}'. Use --format flag.[/{ARBORIC_RED}]"
-                )
-                raise typer.Exit(1)
+        export_format = _resolve_export_format(output, format)
 
         # Export
         try:
@@ -1043,27 +1199,23 @@ minimum cost and carbon emissions.
             console.print(f"[{ARBORIC_RED}]Export failed: {e}[/{ARBORIC_RED}]")
             raise typer.Exit(1)
 
+    if not show:
+        return
+
     # Show results table
-    results_table = Table(
+    results_table = _new_table(
+        _RESULTS_COLUMNS,
         title="[bold]Optimization Results",
         box=box.ROUNDED,
         border_style=ARBORIC_GREEN,
         header_style=f"bold {ARBORIC_GREEN}",
     )
-    results_table.add_column("Workload", style="white", width=36, no_wrap=True)
-    results_table.add_column("Scheduled", justify="center", width=10)
-    results_table.add_column("Delay", justify="right", width=10)
-    results_table.add_column("Cost Saved", justify="right", width=12)
-    results_table.add_column("CO₂ Saved", justify="right", width=12, style=ARBORIC_GREEN)
-
-    total_cost_saved = 0
-    total_carbon_saved = 0
 
     for r in results:
         delay_str = f"+{r.delay_hours:.1f}h" if r.delay_hours > 0 else "Now"
         # Conditional coloring: green if positive savings, amber/yellow if negative
-        cost_color = ARBORIC_GREEN if r.cost_savings >= 0 else ARBORIC_AMBER
-        cost_display = f"[{cost_color}]${r.cost_savings:.2f}[/{cost_color}]"
+        cost_style = _GREEN if r.cost_savings >= 0 else _AMBER
+        cost_display = _styled(f"${r.cost_savings:.2f}", cost_style)
 
         results_table.add_row(
             r.workload.name[:35],
@@ -1072,29 +1224,22 @@ minimum cost and carbon emissions.
             cost_display,
             f"{r.carbon_savings_kg:.2f} kg",
         )
-        total_cost_saved += r.cost_savings
-        total_carbon_saved += r.carbon_savings_kg
 
     # Add totals row with conditional coloring
-    total_cost_color = ARBORIC_GREEN if total_cost_saved >= 0 else ARBORIC_AMBER
+    total_cost_style = _BOLD + (_GREEN if total_cost_saved >= 0 else _AMBER)
     results_table.add_section()
     results_table.add_row(
-        "[bold]TOTAL",
+        _styled("TOTAL", _BOLD),
         "",
         "",
-        f"[bold {total_cost_color}]${total_cost_saved:.2f}[/bold {total_cost_color}]",
-        f"[bold]{total_carbon_saved:.2f} kg",
+        _styled(f"${total_cost_saved:.2f}", total_cost_style),
+        _styled(f"{total_carbon_saved:.2f} kg", _BOLD),
     )
 
     console.print(results_table)
     console.print()
 
     # Calculate fleet statistics
-    total_baseline_cost = sum(r.baseline_cost for r in results)
-    total_optimized_cost = sum(r.optimized_cost for r in results)
-    total_baseline_carbon = sum(r.baseline_carbon_kg for r in results)
-    total_optimized_carbon = sum(r.optimized_carbon_kg for r in results)
-
     cost_reduction_pct = (
         (total_cost_saved / total_baseline_cost * 100) if total_baseline_cost > 0 else 0
     )
@@ -1111,25 +1256,25 @@ minimum cost and carbon emissions.
     cost_savings_label = "SAVINGS" if total_cost_saved >= 0 else "COST"
 
     # Final impact panel with clean formatting
-    saved_label = "saved" if total_cost_saved >= 0 else "increase"
-    impact_lines = [
-        f"[bold {ARBORIC_GREEN}]ARBORIC IMPACT REPORT[/bold {ARBORIC_GREEN}]",
-        "",
-        "[bold]Fleet Optimization Summary[/bold]",
-        f"Workloads Processed:  [bold]{len(demo_workloads)}[/bold]",
-        f"Total Energy:         [bold]{sum(w.energy_kwh for w in demo_workloads):,.0f} kWh[/bold]",
-        "",
-        f"[bold {ARBORIC_RED}]Without Arboric[/bold {ARBORIC_RED}]        [bold {ARBORIC_GREEN}]With Arboric[/bold {ARBORIC_GREEN}]",
-        f"Cost:    ${total_baseline_cost:>8,.2f}         Cost:    ${total_optimized_cost:>8,.2f}",
-        f"Carbon:  {total_baseline_carbon:>8,.2f} kg       Carbon:  {total_optimized_carbon:>8,.2f} kg",
-        "",
-        f"[bold {cost_savings_color}]💰 COST {cost_savings_label}:  ${abs(total_cost_saved):>8,.2f}  ({abs(cost_reduction_pct):.1f}% {saved_label})[/bold {cost_savings_color}]",
-        f"[bold {ARBORIC_GREEN}]🌱 CARBON AVOIDED:  {total_carbon_saved:>8,.2f} kg ({carbon_reduction_pct:.1f}% reduction)[/bold {ARBORIC_GREEN}]",
-        "",
-        f"[bold {cost_savings_color}]💵 ANNUALIZED SAVINGS: ${abs(annual_cost_savings):>,.0f}/year[/bold {cost_savings_color}]",
-        f"[dim]🌲 {annual_carbon_savings / 1000:,.1f} metric tons CO₂ avoided per year[/dim]",
-    ]
-    impact_text = "\n".join(impact_lines)
+    impact_text = _IMPACT_TEMPLATE.format_map(
+        {
+            "workloads": len(demo_workloads),
+            "total_energy": total_energy,
+            "baseline_cost": total_baseline_cost,
+            "optimized_cost": total_optimized_cost,
+            "baseline_carbon": total_baseline_carbon,
+            "optimized_carbon": total_optimized_carbon,
+            "cost_color": cost_savings_color,
+            "cost_label": cost_savings_label,
+            "cost_saved": abs(total_cost_saved),
+            "cost_pct": abs(cost_reduction_pct),
+            "saved_label": "saved" if total_cost_saved >= 0 else "increase",
+            "carbon_saved": total_carbon_saved,
+            "carbon_pct": carbon_reduction_pct,
+            "annual_cost": abs(annual_cost_savings),
+            "annual_carbon_tons": annual_carbon_savings / 1000,
+        }
+    )
 
     console.print(
         Panel(
@@ -1161,6 +1306,11 @@ def forecast(
         None, "--output", "-o", help="Output file path (or '-' for stdout)"
     ),
     format: str | None = typer.Option(None, "--format", "-f", help="Export format: json, csv"),
+    display: bool = typer.Option(
+        True,
+        "--display/--no-display",
+        help="Render results in the terminal (--no-display with --output only writes the export)",
+    ),
 ):
     """
     Display the current grid forecast for a region.
@@ -1169,11 +1319,17 @@ def forecast(
 
     Export forecast: arboric forecast --output forecast.csv --region eastus --hours 24
     """
-    print_banner()
-    console.print()
+    import numpy as np
 
-    console.print(f"[bold]Fetching {hours}h forecast for {region}...[/bold]")
-    console.print()
+    from arboric.core.grid_oracle import get_grid
+
+    show = display or not output
+    if show:
+        print_banner()
+        console.print()
+
+        console.print(f"[bold]Fetching {hours}h forecast for {region}...[/bold]")
+        console.print()
 
     cfg = get_config()
     grid = get_grid(region=region, config=cfg, instance_type=instance_type, cloud_provider=provider)
@@ -1189,34 +1345,25 @@ def forecast(
         now_for_forecast = now_local
     forecast_df = grid.get_forecast(hours=hours, start_time=now_for_forecast)
 
+    # Column arrays shared by the table and the summary
+    prices = forecast_df["price"].to_numpy()
+    carbons = forecast_df["co2_intensity"].to_numpy()
+    renewables = forecast_df["renewable_percentage"].to_numpy()
+
     # Display parameters being used
     resolved_instance = instance_type or "default"
     resolved_provider = provider or "default"
-    console.print(
-        f"[dim]Parameters: region={region}, hours={hours}, instance={resolved_instance}, provider={resolved_provider}[/dim]"
-    )
-    console.print()
+    if show:
+        console.print(
+            f"[dim]Parameters: region={region}, hours={hours}, instance={resolved_instance}, provider={resolved_provider}[/dim]"
+        )
+        console.print()
 
     # Handle export if requested
     if output:
-        from arboric.cli.export import ExportError, ExportFormat, detect_format, export_forecast
+        from arboric.cli.export import ExportError, export_forecast
 
-        # Determine format
-        if format:
-            try:
-                export_format = ExportFormat(format.lower())
-            except ValueError:
-                console.print(
-                    f"[{ARBORIC_RED}]Invalid format '{format}'. Use 'json' or 'csv'.[/{ARBORIC_RED}]"
-                )
-                raise typer.Exit(1)
-        else:
-            export_format = detect_format(output)
-            if not export_format:
-                console.print(
-                    f"[{ARBORIC_RED}]Cannot detect format from '{output}'. Use --format flag.[/{ARBORIC_RED}]"
-                )
-                raise typer.Exit(1)
+        export_format = _resolve_export_format(output, format)
 
         # Export
         try:
@@ -1228,50 +1375,44 @@ def forecast(
             console.print(f"[{ARBORIC_RED}]Export failed: {e}[/{ARBORIC_RED}]")
             raise typer.Exit(1)
 
+    if not show:
+        return
+
     # Create forecast table
-    table = Table(
+    table = _new_table(
+        _FORECAST_COLUMNS,
         title=f"[bold]Grid Forecast: {region}",
         box=box.ROUNDED,
         border_style=ARBORIC_BLUE,
         header_style=f"bold {ARBORIC_BLUE}",
     )
-    table.add_column("Time", style="white", width=8)
-    table.add_column("Price", justify="right", width=12)
-    table.add_column("Carbon", justify="right", width=14)
-    table.add_column("Renewable", justify="right", width=12)
-    table.add_column("Status", justify="center", width=20)
-
-    for timestamp, row in forecast_df.iterrows():
-        # Price color thresholds (spot instance $/hour)
-        price_color = (
-            ARBORIC_GREEN
-            if row["price"] < 6.0
-            else (ARBORIC_AMBER if row["price"] < 12.0 else ARBORIC_RED)
-        )
-        carbon_color = (
-            ARBORIC_GREEN
-            if row["co2_intensity"] < 250
-            else (ARBORIC_AMBER if row["co2_intensity"] < 400 else ARBORIC_RED)
-        )
 
-        # Status indicator
-        status_parts = []
-        if row["price"] < 6.0:
-            status_parts.append("💰 CHEAP")
-        if row["co2_intensity"] < 200:
-            status_parts.append("🌱 GREEN")
-        if row["price"] > 12.0:
-            status_parts.append("⚠️  PEAK")
-        if row["co2_intensity"] > 500:
-            status_parts.append("🏭 DIRTY")
+    # Price color thresholds (spot instance $/hour), as indexes into _LEVEL_STYLES
+    price_levels = np.select([prices < 6.0, prices < 12.0], [0, 1], default=2)
+    carbon_levels = np.select([carbons < 250, carbons < 400], [0, 1], default=2)
 
-        status = " ".join(status_parts) if status_parts else "─"
+    # Status indicator
+    status_labels = ("💰 CHEAP", "🌱 GREEN", "⚠️  PEAK", "🏭 DIRTY")
+    status_flags = zip(prices < 6.0, carbons < 200, prices > 12.0, carbons > 500)
+    statuses = [
+        " ".join(label for label, flag in zip(status_labels, flags) if flag) or "─"
+        for flags in status_flags
+    ]
 
+    for timestamp, price, carbon, renewable, price_level, carbon_level, status in zip(
+        forecast_df.index,
+        prices.tolist(),
+        carbons.tolist(),
+        renewables.tolist(),
+        price_levels.tolist(),
+        carbon_levels.tolist(),
+        statuses,
+    ):
         table.add_row(
             format_local_time(timestamp),
-            f"[{price_color}]${row['price']:.4f}[/{price_color}]",
-            f"[{carbon_color}]{row['co2_intensity']:.0f} gCO₂[/{carbon_color}]",
-            f"{row['renewable_percentage']:.0f}%",
+            _styled(f"${price:.4f}", _LEVEL_STYLES[price_level]),
+            _styled(f"{carbon:.0f} gCO₂", _LEVEL_STYLES[carbon_level]),
+            f"{renewable:.0f}%",
             status,
         )
 
@@ -1280,23 +1421,19 @@ def forecast(
     # Summary stats
     console.print()
     console.print("[bold]Summary:[/bold]")
-    console.print(
-        f"  Price range:  ${forecast_df['price'].min():.2f} - ${forecast_df['price'].max():.2f}/hr"
-    )
-    console.print(
-        f"  Carbon range: {forecast_df['co2_intensity'].min():.0f} - {forecast_df['co2_intensity'].max():.0f} gCO₂/kWh"
-    )
+    console.print(f"  Price range:  ${np.nanmin(prices):.2f} - ${np.nanmax(prices):.2f}/hr")
+    console.print(f"  Carbon range: {np.nanmin(carbons):.0f} - {np.nanmax(carbons):.0f} gCO₂/kWh")
 
     # Best windows
-    best_price_idx = forecast_df["price"].idxmin()
-    best_carbon_idx = forecast_df["co2_intensity"].idxmin()
+    best_price_pos = int(np.nanargmin(prices))
+    best_carbon_pos = int(np.nanargmin(carbons))
 
     console.print()
     console.print(
-        f"[bold {ARBORIC_GREEN}]Best price window:[/bold {ARBORIC_GREEN}] {format_local_time(best_price_idx)} (${forecast_df.loc[best_price_idx, 'price']:.2f}/hr)"
+        f"[bold {ARBORIC_GREEN}]Best price window:[/bold {ARBORIC_GREEN}] {format_local_time(forecast_df.index[best_price_pos])} (${prices[best_price_pos]:.2f}/hr)"
     )
     console.print(
-        f"[bold {ARBORIC_GREEN}]Greenest window:[/bold {ARBORIC_GREEN}] {format_local_time(best_carbon_idx)} ({forecast_df.loc[best_carbon_idx, 'co2_intensity']:.0f} gCO₂/kWh)"
+        f"[bold {ARBORIC_GREEN}]Greenest window:[/bold {ARBORIC_GREEN}] {format_local_time(forecast_df.index[best_carbon_pos])} ({carbons[best_carbon_pos]:.0f} gCO₂/kWh)"
     )
 
 
@@ -1314,14 +1451,12 @@ def status():
     mode = "live" if getattr(grid, "is_live", False) else "simulation"
     grid_details = f"Grid ({mode} mode)"
 
-    status_table = Table(
+    status_table = _new_table(
+        _STATUS_COLUMNS,
         title="[bold]System Status",
         box=box.ROUNDED,
         border_style=ARBORIC_BLUE,
     )
-    status_table.add_column("Component", style="white", width=25)
-    status_table.add_column("Status", justify="center", width=15)
-    status_table.add_column("Details", width=35)
 
     status_table.add_row(
         "Grid Oracle",
@@ -1401,8 +1536,6 @@ def config(
         # Display current configuration
         try:
             cfg = get_config()
-            console.print(f"\n[bold {ARBORIC_BLUE}]Arboric Configuration[/bold {ARBORIC_BLUE}]")
-            console.print(f"[dim]Loaded from: {config_path}[/dim]\n")
 
             # Optimization settings
             opt_table = Table(
@@ -1417,8 +1550,6 @@ def config(
             opt_table.add_row("Carbon Weight", f"{cfg.optimization.carbon_weight:.1%}")
             opt_table.add_row("Min Delay (hours)", f"{cfg.optimization.min_delay_hours}")
             opt_table.add_row("Prefer Continuous", str(cfg.optimization.prefer_continuous))
-            console.print(opt_table)
-            console.print()
 
             # Default workload settings
             default_table = Table(
@@ -1433,8 +1564,6 @@ def config(
             default_table.add_row("Power Draw", f"{cfg.defaults.power_draw_kw} kW")
             default_table.add_row("Deadline", f"{cfg.defaults.deadline_hours}h")
             default_table.add_row("Region", cfg.defaults.region)
-            console.print(default_table)
-            console.print()
 
             # CLI settings
             cli_table = Table(
@@ -1449,17 +1578,30 @@ def config(
             cli_table.add_row("Color Theme", cfg.cli.color_theme)
             cli_table.add_row("Quiet Mode", str(cfg.cli.quiet_mode))
             cli_table.add_row("Auto Approve", str(cfg.cli.auto_approve))
-            console.print(cli_table)
-            console.print()
 
             # Live data settings
             if cfg.live_data.enabled:
-                console.print(f"[{ARBORIC_GREEN}]✓[/{ARBORIC_GREEN}] Live data integration enabled")
+                live_data = f"[{ARBORIC_GREEN}]✓[/{ARBORIC_GREEN}] Live data integration enabled"
             else:
-                console.print(
-                    f"[{ARBORIC_AMBER}]○[/{ARBORIC_AMBER}] Live data integration disabled"
+                live_data = f"[{ARBORIC_AMBER}]○[/{ARBORIC_AMBER}] Live data integration disabled"
+
+            # Render everything in one pass
+            console.print(
+                Group(
+                    "",
+                    f"[bold {ARBORIC_BLUE}]Arboric Configuration[/bold {ARBORIC_BLUE}]",
+                    f"[dim]Loaded from: {config_path}[/dim]",
+                    "",
+                    opt_table,
+                    "",
+                    default_table,
+                    "",
+                    cli_table,
+                    "",
+                    live_data,
+                    "",
                 )
-            console.print()
+            )
 
         except Exception as e:
             console.print(f"[{ARBORIC_RED}]Error loading configuration: {e}[/{ARBORIC_RED}]")
@@ -1484,7 +1626,6 @@ def config(
     elif action == "edit":
         # Open config file in editor
         import os
-        import subprocess
 
         if not config_path.exists():
             console.print(
@@ -1495,8 +1636,17 @@ def config(
         # Try to open in user's preferred editor
         editor = os.environ.get("EDITOR", os.environ.get("VISUAL", "nano"))
         try:
-            subprocess.run([editor, str(config_path)], check=True)
-            console.print(f"[{ARBORIC_GREEN}]✓[/{ARBORIC_GREEN}] Configuration saved")
+            if os.name == "nt":
+                # exec on Windows spawns a child and exits, detaching the console
+                import subprocess
+
+                subprocess.run([editor, str(config_path)], check=True)
+                console.print(f"[{ARBORIC_GREEN}]✓[/{ARBORIC_GREEN}] Configuration saved")
+            else:
+                # Nothing runs after the editor, so hand the process over to it
+                # (execvp raises before replacing us if the editor is missing)
+                console.file.flush()
+                os.execvp(editor, [editor, str(config_path)])
         except FileNotFoundError:
             console.print(
                 f"[{ARBORIC_AMBER}]Editor '{editor}' not found. Config file location:[/{ARBORIC_AMBER}]"
@@ -1537,6 +1687,8 @@ def history(
     """
     from pathlib import Path
 
+    from arboric.core.history import HistoryStore
+
     cfg = get_config()
 
     # Parse since parameter
@@ -1609,6 +1761,8 @@ def insights(
     """
     from pathlib import Path
 
+    from arboric.core.history import HistoryStore
+
     cfg = get_config()
 
     # Parse period parameter
@@ -5,25 +5,30 @@ Core functionality including optimization algorithms, data models,
 and grid forecasting.
 """
 
-from arboric.core.autopilot import Autopilot, OptimizationConfig, create_autopilot
-from arboric.core.config import (
-    ArboricConfig,
-    CLISettings,
-    DefaultWorkloadSettings,
-    LiveDataSettings,
-    OptimizationSettings,
-    get_config,
-    reset_config,
-)
-from arboric.core.grid_oracle import MockGrid, get_grid
-from arboric.core.models import (
-    FleetOptimizationResult,
-    GridWindow,
-    ScheduleResult,
-    Workload,
-    WorkloadPriority,
-    WorkloadType,
-)
+import importlib
+from typing import Any
+
+# Exports resolve on first access; see arboric/__init__.py.
+_LAZY_EXPORTS = {
+    "Autopilot": "arboric.core.autopilot",
+    "OptimizationConfig": "arboric.core.autopilot",
+    "create_autopilot": "arboric.core.autopilot",
+    "ArboricConfig": "arboric.core.config",
+    "CLISettings": "arboric.core.config",
+    "DefaultWorkloadSettings": "arboric.core.config",
+    "LiveDataSettings": "arboric.core.config",
+    "OptimizationSettings": "arboric.core.config",
+    "get_config": "arboric.core.config",
+    "reset_config": "arboric.core.config",
+    "MockGrid": "arboric.core.grid_oracle",
+    "get_grid": "arboric.core.grid_oracle",
+    "FleetOptimizationResult": "arboric.core.models",
+    "GridWindow": "arboric.core.models",
+    "ScheduleResult": "arboric.core.models",
+    "Workload": "arboric.core.models",
+    "WorkloadPriority": "arboric.core.models",
+    "WorkloadType": "arboric.core.models",
+}
 
 __all__ = [
     # Models
@@ -49,3 +54,16 @@ __all__ = [
     "get_config",
     "reset_config",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    """Import a public export on first access."""
+    if name not in _LAZY_EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(_LAZY_EXPORTS[name]), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted([*globals(), *_LAZY_EXPORTS])
@@ -0,0 +1,229 @@
+"""
+Numeric kernels for the Autopilot window scan.
+
+The kernels operate on raw float64 price and carbon arrays instead of
+DataFrame slices. When numba is installed (pip install arboric[fast]) they
+are JIT-compiled; otherwise they run as plain Python over NumPy arrays,
+which is still far cheaper than slicing the forecast once per window.
+"""
+
+from typing import Any
+
+import numpy as np
+
+# Try to import numba, but don't fail at module load time
+NUMBA_AVAILABLE = False
+try:
+    from numba import njit, prange
+
+    NUMBA_AVAILABLE = True
+except ImportError:
+    prange = range
+
+    def njit(*args: Any, **kwargs: Any) -> Any:
+        """No-op stand-in for numba.njit when numba is not installed."""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda func: func
+
+
+# Relative tolerance for treating two window scores as equal. Prefix sums
+# drift by a few ulps, so exact ties (identical windows) must still resolve
+# to the earliest start, as a window-by-window scan would.
+TIE_TOLERANCE = 1e-9
+
+
+def prefix_sums(values: np.ndarray) -> np.ndarray:
+    """
+    Cumulative sums with a leading zero.
+
+    The sum of values[s:s + n] is prefix[s + n] - prefix[s], so every window
+    of a forecast can be evaluated from one pass over the array.
+
+    Args:
+        values: float64 array (e.g. forecast prices)
+
+    Returns:
+        float64 array of length len(values) + 1
+    """
+    prefix = np.zeros(len(values) + 1)
+    np.cumsum(values, out=prefix[1:])
+    return prefix
+
+
+def _best_window_numpy(
+    price_prefix: np.ndarray,
+    carbon_prefix: np.ndarray,
+    first_start: int,
+    last_start: int,
+    windows_needed: int,
+    cost_weight: float,
+    carbon_weight: float,
+    price_ceiling: float,
+    carbon_ceiling: float,
+) -> tuple[int, int]:
+    """
+    Score every feasible start index and pick the best window.
+
+    Window averages come from prefix sums (see prefix_sums), so each window
+    costs two subtractions and the whole scan is a handful of array ops.
+
+    Args:
+        price_prefix: Prefix sums of the spot price array ($/hr)
+        carbon_prefix: Prefix sums of the carbon intensity array (gCO2/kWh)
+        first_start: First feasible start index
+        last_start: Last feasible start index (inclusive)
+        windows_needed: Number of forecast slots the workload occupies
+        cost_weight: Weight of the normalized price in the composite score
+        carbon_weight: Weight of the normalized carbon in the composite score
+        price_ceiling: Price treated as 100% on the normalized scale
+        carbon_ceiling: Carbon intensity treated as 100% on the normalized scale
+
+    Returns:
+        Tuple of (best_start, cheapest_start): the earliest start with the
+        minimum composite score and the earliest start with the minimum
+        average price. Both are -1 when no window is feasible.
+    """
+    if last_start < first_start:
+        return -1, -1
+
+    start, stop = first_start, last_start + 1
+    shift = windows_needed
+    avg_prices = (price_prefix[start + shift : stop + shift] - price_prefix[start:stop]) / shift
+    avg_carbons = (carbon_prefix[start + shift : stop + shift] - carbon_prefix[start:stop]) / shift
+
+    scores = (
+        np.minimum(avg_prices / price_ceiling, 1.0) * 100 * cost_weight
+        + np.minimum(avg_carbons / carbon_ceiling, 1.0) * 100 * carbon_weight
+    )
+
+    min_score = scores.min()
+    min_price = avg_prices.min()
+    score_cutoff = min_score + TIE_TOLERANCE * max(1.0, abs(min_score))
+    price_cutoff = min_price + TIE_TOLERANCE * max(1.0, abs(min_price))
+
+    best_start = first_start + int(np.argmax(scores <= score_cutoff))
+    cheapest_start = first_start + int(np.argmax(avg_prices <= price_cutoff))
+    return best_start, cheapest_start
+
+
+@njit(cache=True)
+def _best_window_loop(
+    price_prefix: np.ndarray,
+    carbon_prefix: np.ndarray,
+    first_start: int,
+    last_start: int,
+    windows_needed: int,
+    cost_weight: float,
+    carbon_weight: float,
+    price_ceiling: float,
+    carbon_ceiling: float,
+) -> tuple[int, int]:
+    """
+    Loop form of _best_window_numpy for the numba build.
+
+    Compiled, two passes over the prefix sums (find the minimums, then the
+    earliest start within tolerance of them) beat the array version, which
+    allocates four temporaries per call. Scores are computed with the same
+    operations in the same order (no fastmath), so both forms return the
+    same starts.
+    """
+    if last_start < first_start:
+        return -1, -1
+
+    shift = windows_needed
+    min_score = np.inf
+    min_price = np.inf
+    for start in range(first_start, last_start + 1):
+        avg_price = (price_prefix[start + shift] - price_prefix[start]) / shift
+        avg_carbon = (carbon_prefix[start + shift] - carbon_prefix[start]) / shift
+        score = (
+            min(avg_price / price_ceiling, 1.0) * 100 * cost_weight
+            + min(avg_carbon / carbon_ceiling, 1.0) * 100 * carbon_weight
+        )
+        min_score = min(min_score, score)
+        min_price = min(min_price, avg_price)
+
+    score_cutoff = min_score + TIE_TOLERANCE * max(1.0, abs(min_score))
+    price_cutoff = min_price + TIE_TOLERANCE * max(1.0, abs(min_price))
+
+    best_start = -1
+    cheapest_start = -1
+    for start in range(first_start, last_start + 1):
+        avg_price = (price_prefix[start + shift] - price_prefix[start]) / shift
+        avg_carbon = (carbon_prefix[start + shift] - carbon_prefix[start]) / shift
+        score = (
+            min(avg_price / price_ceiling, 1.0) * 100 * cost_weight
+            + min(avg_carbon / carbon_ceiling, 1.0) * 100 * carbon_weight
+        )
+        if best_start < 0 and score <= score_cutoff:
+            best_start = start
+        if cheapest_start < 0 and avg_price <= price_cutoff:
+            cheapest_start = start
+        if best_start >= 0 and cheapest_start >= 0:
+            break
+    return best_start, cheapest_start
+
+
+# Compiled loops win under numba; array ops win in the interpreter
+best_window = _best_window_loop if NUMBA_AVAILABLE else _best_window_numpy
+
+
+@njit(cache=True, parallel=True)
+def best_windows(
+    price_prefix: np.ndarray,
+    carbon_prefix: np.ndarray,
+    first_starts: np.ndarray,
+    last_starts: np.ndarray,
+    windows_needed: np.ndarray,
+    cost_weight: float,
+    carbon_weight: float,
+    price_ceiling: float,
+    carbon_ceiling: float,
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Run best_window for several workloads over the same forecast.
+
+    With numba the workloads are scanned in parallel threads.
+
+    Args:
+        price_prefix: Prefix sums of the spot price array ($/hr)
+        carbon_prefix: Prefix sums of the carbon intensity array (gCO2/kWh)
+        first_starts: int64 array of first feasible start index per workload
+        last_starts: int64 array of last feasible start index per workload
+        windows_needed: int64 array of forecast slots each workload occupies
+        cost_weight: Weight of the normalized price in the composite score
+        carbon_weight: Weight of the normalized carbon in the composite score
+        price_ceiling: Price treated as 100% on the normalized scale
+        carbon_ceiling: Carbon intensity treated as 100% on the normalized scale
+
+    Returns:
+        Tuple of int64 arrays (best_starts, cheapest_starts), -1 where no
+        window is feasible
+    """
+    count = len(first_starts)
+    best_starts = np.empty(count, dtype=np.int64)
+    cheapest_starts = np.empty(count, dtype=np.int64)
+    for i in prange(count):
+        best_start, cheapest_start = best_window(
+            price_prefix,
+            carbon_prefix,
+            first_starts[i],
+            last_starts[i],
+            windows_needed[i],
+            cost_weight,
+            carbon_weight,
+            price_ceiling,
+            carbon_ceiling,
+        )
+        best_starts[i] = best_start
+        cheapest_starts[i] = cheapest_start
+    return best_starts, cheapest_starts
+
+
+def warm_up() -> None:
+    """Compile the kernels ahead of the first real call (no-op without numba)."""
+    prefix = prefix_sums(np.ones(4))
+    best_window(prefix, prefix, 0, 2, 2, 0.7, 0.3, 35.0, 600.0)
+    bounds = np.zeros(1, dtype=np.int64)
+    best_windows(prefix, prefix, bounds, bounds + 2, bounds + 2, 0.7, 0.3, 35.0, 600.0)
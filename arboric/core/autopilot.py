@@ -11,11 +11,15 @@ Architecture:
 - Future: constraint satisfaction for multi-workload dependencies
 """
 
-from datetime import timedelta
+from dataclasses import dataclass, replace
+from datetime import datetime, timedelta
 from uuid import UUID
 
+import numpy as np
 import pandas as pd
+from numpy.lib.stride_tricks import sliding_window_view
 
+from arboric.core._kernels import best_window, best_windows, prefix_sums
 from arboric.core.models import (
     FleetOptimizationResult,
     RegionComparisonResult,
@@ -34,33 +38,50 @@ DEFAULT_CARBON_WEIGHT = 0.3
 # Raised to 35.0 to cover highest-tier GPU on-demand (p4d.24xlarge: $32.77/hr)
 SPOT_PRICE_NORMALIZATION_CEILING = 35.0  # $/hr
 
+# Normalization ceiling for carbon intensity ("bad" grid, 100 gCO2/kWh is "good")
+CARBON_NORMALIZATION_CEILING = 600.0  # gCO2/kWh
 
+
+@dataclass(frozen=True, slots=True)
 class OptimizationConfig:
-    """Configuration for the optimization algorithm."""
+    """
+    Configuration for the optimization algorithm.
 
-    def __init__(
-        self,
-        cost_weight: float = DEFAULT_COST_WEIGHT,
-        carbon_weight: float = DEFAULT_CARBON_WEIGHT,
-        min_delay_hours: float = 0,
-        prefer_continuous: bool = True,
-    ):
-        """
-        Args:
-            cost_weight: Weight for cost optimization (0-1)
-            carbon_weight: Weight for carbon optimization (0-1)
-            min_delay_hours: Minimum delay before starting (e.g., for prep time)
-            prefer_continuous: Prefer continuous windows over fragmented
-        """
-        if not (0 <= cost_weight <= 1 and 0 <= carbon_weight <= 1):
+    Args:
+        cost_weight: Weight for cost optimization (0-1)
+        carbon_weight: Weight for carbon optimization (0-1)
+        min_delay_hours: Minimum delay before starting (e.g., for prep time)
+        prefer_continuous: Prefer continuous windows over fragmented
+    """
+
+    cost_weight: float = DEFAULT_COST_WEIGHT
+    carbon_weight: float = DEFAULT_CARBON_WEIGHT
+    min_delay_hours: float = 0
+    prefer_continuous: bool = True
+
+    def __post_init__(self) -> None:
+        if not (0 <= self.cost_weight <= 1 and 0 <= self.carbon_weight <= 1):
             raise ValueError("Weights must be between 0 and 1")
-        if abs(cost_weight + carbon_weight - 1.0) > 0.01:
+        if abs(self.cost_weight + self.carbon_weight - 1.0) > 0.01:
             raise ValueError("Weights must sum to 1.0")
 
-        self.cost_weight = cost_weight
-        self.carbon_weight = carbon_weight
-        self.min_delay_hours = min_delay_hours
-        self.prefer_continuous = prefer_continuous
+
+@dataclass(frozen=True)
+class _PreparedForecast:
+    """
+    Forecast data in the array form the window scan works on.
+
+    Built once per forecast by Autopilot._prepare so that several workloads
+    scheduled against the same forecast share the conversion and prefix sums.
+    """
+
+    index: pd.DatetimeIndex
+    prices: np.ndarray
+    carbons: np.ndarray
+    price_prefix: np.ndarray
+    carbon_prefix: np.ndarray
+    resolution_hours: float
+    on_demand_rate: float | None
 
 
 class Autopilot:
@@ -71,13 +92,21 @@ class Autopilot:
     based on a weighted combination of cost and carbon metrics.
     """
 
-    def __init__(self, config: OptimizationConfig | None = None):
+    def __init__(self, config: OptimizationConfig | None = None, enable_log: bool = True):
+        """
+        Args:
+            config: Optimization settings (defaults to OptimizationConfig())
+            enable_log: Record the optimization log returned by get_log; callers
+                        that never read it (API, fleet workers) can turn it off
+        """
         self.config = config or OptimizationConfig()
+        self._logging_enabled = enable_log
         self._optimization_log: list[str] = []
 
     def _log(self, message: str):
         """Internal logging for debugging and display."""
-        self._optimization_log.append(message)
+        if self._logging_enabled:
+            self._optimization_log.append(message)
 
     def get_log(self) -> list[str]:
         """Get optimization log messages."""
@@ -87,71 +116,56 @@ class Autopilot:
         """Clear the optimization log."""
         self._optimization_log = []
 
-    def _calculate_window_score(
+    def _window_metrics(
         self,
-        forecast_slice: pd.DataFrame,
+        prices: np.ndarray,
+        carbons: np.ndarray,
+        start_idx: int,
+        windows_needed: int,
         workload: Workload,
-    ) -> tuple[float, float, float]:
+    ) -> tuple[float, float, float, float, float]:
         """
-        Calculate the composite score for a potential execution window.
+        Calculate window metrics directly from forecast arrays.
+
+        Scores the window starting at start_idx; averages are computed the
+        same way pandas computes them for the equivalent DataFrame slice.
 
         Returns:
-            Tuple of (composite_score, total_cost, total_carbon_kg)
+            Tuple of (composite_score, total_cost, total_carbon_kg, avg_price, avg_carbon)
         """
-        if forecast_slice.empty:
-            return float("inf"), 0, 0
-
-        # Calculate metrics for this window
-        avg_spot_price = forecast_slice["price"].mean()  # $/hr
-        avg_carbon = forecast_slice["co2_intensity"].mean()
+        end_idx = start_idx + windows_needed
+        avg_spot_price = float(prices[start_idx:end_idx].mean())
+        avg_carbon = float(carbons[start_idx:end_idx].mean())
 
-        # Total cost = spot rate ($/hr) * duration (hours)
-        # Note: cost is now independent of power draw (which still affects carbon)
+        # Total cost = spot rate ($/hr) * duration (hours); independent of power draw
         total_cost = avg_spot_price * workload.duration_hours
-
         # Total carbon = intensity * energy / 1000 (convert g to kg)
-        energy_kwh = workload.energy_kwh
-        total_carbon_kg = (avg_carbon * energy_kwh) / 1000
+        total_carbon_kg = (avg_carbon * workload.energy_kwh) / 1000
 
-        # Normalize for scoring (scale to comparable ranges)
-        # Price: assume $25/hr is "bad" (on-demand rate), lower is better
+        # Normalize for scoring (lower is better)
         price_normalized = min(avg_spot_price / SPOT_PRICE_NORMALIZATION_CEILING, 1.0) * 100
-
-        # Carbon: assume 600 gCO2/kWh is "bad", 100 gCO2/kWh is "good"
-        carbon_normalized = min(avg_carbon / 600, 1.0) * 100
-
-        # Weighted composite score (lower is better)
+        carbon_normalized = min(avg_carbon / CARBON_NORMALIZATION_CEILING, 1.0) * 100
         composite = (
             price_normalized * self.config.cost_weight
             + carbon_normalized * self.config.carbon_weight
         )
 
-        return composite, total_cost, total_carbon_kg
+        return composite, total_cost, total_carbon_kg, avg_spot_price, avg_carbon
 
-    def optimize_schedule(
-        self,
-        workload: Workload,
-        forecast_df: pd.DataFrame,
-    ) -> ScheduleResult:
+    def _prepare(self, forecast_df: pd.DataFrame) -> _PreparedForecast:
         """
-        Find the optimal start time for a workload.
-
-        Algorithm:
-        1. Calculate baseline metrics (immediate start)
-        2. Scan all feasible start times within deadline
-        3. For each window, calculate composite score
-        4. Return the window with minimum score
+        Convert a forecast into the arrays used by the window scan.
 
         Args:
-            workload: The workload to schedule
             forecast_df: Grid forecast DataFrame with timestamp index
 
         Returns:
-            ScheduleResult with optimal vs baseline comparison
-        """
-        self.clear_log()
-        self._log(f"Initializing optimization for: {workload.name}")
+            _PreparedForecast with price/carbon arrays, their prefix sums,
+            the time resolution and the on-demand rate (if present)
 
+        Raises:
+            ValueError: If the forecast is empty
+        """
         if forecast_df.empty:
             raise ValueError("Forecast data is empty")
 
@@ -166,24 +180,125 @@ class Autopilot:
         else:
             resolution_hours = 1.0
 
+        prices = forecast_df["price"].to_numpy(dtype=np.float64)
+        carbons = forecast_df["co2_intensity"].to_numpy(dtype=np.float64)
+
+        # Extract on-demand rate if instance was specified
+        on_demand_rate = (
+            forecast_df["on_demand_rate"].iloc[0]
+            if "on_demand_rate" in forecast_df.columns
+            else None
+        )
+
+        return _PreparedForecast(
+            index=forecast_df.index,
+            prices=prices,
+            carbons=carbons,
+            price_prefix=prefix_sums(prices),
+            carbon_prefix=prefix_sums(carbons),
+            resolution_hours=resolution_hours,
+            on_demand_rate=on_demand_rate,
+        )
+
+    def _scan_bounds(self, workload: Workload, prepared: _PreparedForecast) -> tuple[int, int, int]:
+        """
+        Work out the window size and feasible start range for a workload.
+
+        Args:
+            workload: The workload to schedule
+            prepared: Prepared grid forecast
+
+        Returns:
+            Tuple of (windows_needed, first_start, last_start); the range is
+            empty when last_start < first_start
+        """
+        resolution_hours = prepared.resolution_hours
+        index = prepared.index
+
         # Calculate number of windows needed for workload
         windows_needed = max(1, int(workload.duration_hours / resolution_hours))
 
-        baseline_start = forecast_df.index[0]
-        deadline = baseline_start + timedelta(hours=workload.deadline_hours)
+        # Minimum delay handling
+        min_delay_windows = int(self.config.min_delay_hours / resolution_hours)
+
+        # Calculate latest possible start (must finish by deadline)
+        max_start_idx = len(index) - windows_needed
+
+        # Also limit by deadline: binary search for the first start whose run
+        # would end past it
+        deadline = index[0] + timedelta(hours=workload.deadline_hours)
+        latest_start = deadline - timedelta(hours=workload.duration_hours)
+        first_late_idx = int(index.searchsorted(latest_start, side="right"))
+        max_start_idx = min(max_start_idx, first_late_idx - 1)
+
+        return windows_needed, min_delay_windows, max_start_idx
+
+    def optimize_schedule(self, workload: Workload, forecast_df: pd.DataFrame) -> ScheduleResult:
+        """
+        Find the optimal start time for a workload.
+
+        Algorithm:
+        1. Calculate baseline metrics (immediate start)
+        2. Scan all feasible start times within deadline
+        3. For each window, calculate composite score
+        4. Return the window with minimum score
+
+        Args:
+            workload: The workload to schedule
+            forecast_df: Grid forecast DataFrame with timestamp index
+
+        Returns:
+            ScheduleResult with optimal vs baseline comparison
+        """
+        self.clear_log()
+        return self._optimize_prepared(workload, self._prepare(forecast_df))
 
-        self._log(f"Workload duration: {workload.duration_hours}h ({windows_needed} windows)")
-        self._log(f"Deadline: {deadline.strftime('%Y-%m-%d %H:%M')}")
-        self._log(f"Scanning {len(forecast_df)} forecast windows...")
+    def _optimize_prepared(
+        self,
+        workload: Workload,
+        prepared: _PreparedForecast,
+        scan_result: tuple[int, int] | None = None,
+    ) -> ScheduleResult:
+        """
+        Find the optimal start time for a workload on a prepared forecast.
+
+        Args:
+            workload: The workload to schedule
+            prepared: Prepared grid forecast (see _prepare)
+            scan_result: Optional (best_start, cheapest_start) from a batched
+                         fleet scan, which skips the per-workload scan
+
+        Returns:
+            ScheduleResult with optimal vs baseline comparison
+        """
+        self._log(f"Initializing optimization for: {workload.name}")
+
+        windows_needed, min_delay_windows, max_start_idx = self._scan_bounds(workload, prepared)
+
+        baseline_start = prepared.index[0]
+
+        if self._logging_enabled:
+            deadline = baseline_start + timedelta(hours=workload.deadline_hours)
+            self._log(f"Workload duration: {workload.duration_hours}h ({windows_needed} windows)")
+            self._log(f"Deadline: {deadline.strftime('%Y-%m-%d %H:%M')}")
+            self._log(f"Scanning {len(prepared.index)} forecast windows...")
+
+        prices = prepared.prices
+        carbons = prepared.carbons
+
+        # Calculate baseline (immediate start)
+        (
+            baseline_score,
+            baseline_cost,
+            baseline_carbon,
+            baseline_avg_price,
+            baseline_avg_carbon,
+        ) = self._window_metrics(prices, carbons, 0, windows_needed, workload)
 
         # Priority handling
         if workload.priority == WorkloadPriority.CRITICAL:
             self._log("CRITICAL priority - forcing immediate execution")
             # For critical workloads, return baseline as optimal
-            baseline_slice = forecast_df.iloc[:windows_needed]
-            _, baseline_cost, baseline_carbon = self._calculate_window_score(
-                baseline_slice, workload
-            )
             return ScheduleResult(
                 workload=workload,
                 optimal_start=baseline_start,
@@ -192,64 +307,71 @@ class Autopilot:
                 baseline_end=baseline_start + timedelta(hours=workload.duration_hours),
                 optimized_cost=baseline_cost,
                 optimized_carbon_kg=baseline_carbon,
-                optimized_avg_price=baseline_slice["price"].mean(),
-                optimized_avg_carbon=baseline_slice["co2_intensity"].mean(),
+                optimized_avg_price=baseline_avg_price,
+                optimized_avg_carbon=baseline_avg_carbon,
                 baseline_cost=baseline_cost,
                 baseline_carbon_kg=baseline_carbon,
-                baseline_avg_price=baseline_slice["price"].mean(),
-                baseline_avg_carbon=baseline_slice["co2_intensity"].mean(),
+                baseline_avg_price=baseline_avg_price,
+                baseline_avg_carbon=baseline_avg_carbon,
                 cost_constrained=False,
             )
 
-        # Calculate baseline (immediate start)
-        baseline_slice = forecast_df.iloc[:windows_needed]
-        baseline_score, baseline_cost, baseline_carbon = self._calculate_window_score(
-            baseline_slice, workload
-        )
-        baseline_avg_price = baseline_slice["price"].mean()
-        baseline_avg_carbon = baseline_slice["co2_intensity"].mean()
-
         self._log(
             f"Baseline score: {baseline_score:.2f} (${baseline_cost:.2f}, {baseline_carbon:.2f}kg CO2)"
         )
 
-        # Scan all feasible start times
-        best_score = float("inf")
-        best_start_idx = 0
-        best_cost = baseline_cost
-        best_carbon = baseline_carbon
-
-        # Minimum delay handling
-        min_delay_windows = int(self.config.min_delay_hours / resolution_hours)
-
-        # Calculate latest possible start (must finish by deadline)
-        max_start_idx = len(forecast_df) - windows_needed
-
-        # Also limit by deadline
-        for idx in range(len(forecast_df)):
-            potential_end = forecast_df.index[idx] + timedelta(hours=workload.duration_hours)
-            if potential_end > deadline:
-                max_start_idx = min(max_start_idx, idx - 1)
-                break
-
         self._log(f"Feasible start window: index {min_delay_windows} to {max_start_idx}")
 
-        scores_by_hour = []
-
-        for start_idx in range(min_delay_windows, max_start_idx + 1):
-            end_idx = start_idx + windows_needed
-            if end_idx > len(forecast_df):
-                break
-
-            window_slice = forecast_df.iloc[start_idx:end_idx]
-            score, cost, carbon = self._calculate_window_score(window_slice, workload)
-            scores_by_hour.append((start_idx, score, cost, carbon))
-
-            if score < best_score:
-                best_score = score
-                best_start_idx = start_idx
-                best_cost = cost
-                best_carbon = carbon
+        # With at most one feasible start there is nothing to compare
+        if scan_result is None and max_start_idx <= min_delay_windows:
+            self._log("At most one feasible start window, skipping scan")
+            if max_start_idx == min_delay_windows:
+                scan_result = (max_start_idx, max_start_idx)
+            else:
+                scan_result = (-1, -1)
+
+        # No window can average below the cheapest (or cleanest) slot it covers,
+        # so a baseline scoring at that bound is optimal without a scan
+        if scan_result is None and min_delay_windows == 0 <= max_start_idx:
+            covered = slice(0, max_start_idx + windows_needed)
+            lower_bound = (
+                min(prices[covered].min() / SPOT_PRICE_NORMALIZATION_CEILING, 1.0)
+                * 100
+                * self.config.cost_weight
+                + min(carbons[covered].min() / CARBON_NORMALIZATION_CEILING, 1.0)
+                * 100
+                * self.config.carbon_weight
+            )
+            if baseline_score <= lower_bound:
+                self._log("Baseline window is already optimal, skipping scan")
+                scan_result = (0, 0)
+
+        # Scan all feasible start times (unless a batched fleet scan already did)
+        if scan_result is None:
+            scan_result = best_window(
+                prepared.price_prefix,
+                prepared.carbon_prefix,
+                min_delay_windows,
+                max_start_idx,
+                windows_needed,
+                self.config.cost_weight,
+                self.config.carbon_weight,
+                SPOT_PRICE_NORMALIZATION_CEILING,
+                CARBON_NORMALIZATION_CEILING,
+            )
+        best_start_idx, cheapest_start_idx = scan_result
+
+        if best_start_idx < 0:
+            # No feasible window: fall back to immediate start
+            best_start_idx = 0
+            best_cost = baseline_cost
+            best_carbon = baseline_carbon
+            optimal_avg_price = baseline_avg_price
+            optimal_avg_carbon = baseline_avg_carbon
+        else:
+            _, best_cost, best_carbon, optimal_avg_price, optimal_avg_carbon = self._window_metrics(
+                prices, carbons, best_start_idx, windows_needed, workload
+            )
 
         # Check cost constraint: optimized cost must not exceed baseline cost
         cost_constrained = False
@@ -260,20 +382,23 @@ class Autopilot:
             )
             self._log("Falling back to minimum-cost window...")
 
-            # Find window with minimum cost (ignoring composite score)
-            min_cost_idx = 0
-            min_cost = baseline_cost
-            min_cost_carbon = baseline_carbon
-
-            for start_idx, score, cost, carbon in scores_by_hour:
-                if cost < min_cost:
-                    min_cost = cost
-                    min_cost_idx = start_idx
-                    min_cost_carbon = carbon
+            # Use the window with minimum cost (ignoring composite score),
+            # or the immediate start if no window beats the baseline
+            best_start_idx = 0
+            best_cost = baseline_cost
+            best_carbon = baseline_carbon
+            optimal_avg_price = baseline_avg_price
+            optimal_avg_carbon = baseline_avg_carbon
 
-            best_start_idx = min_cost_idx
-            best_cost = min_cost
-            best_carbon = min_cost_carbon
+            _, cost, carbon, avg_price, avg_carbon = self._window_metrics(
+                prices, carbons, cheapest_start_idx, windows_needed, workload
+            )
+            if cost < baseline_cost:
+                best_start_idx = cheapest_start_idx
+                best_cost = cost
+                best_carbon = carbon
+                optimal_avg_price = avg_price
+                optimal_avg_carbon = avg_carbon
             cost_constrained = True
 
             self._log(
@@ -281,23 +406,16 @@ class Autopilot:
             )
 
         # Find optimal window details
-        optimal_start = forecast_df.index[best_start_idx]
+        optimal_start = prepared.index[best_start_idx]
         optimal_end = optimal_start + timedelta(hours=workload.duration_hours)
-        optimal_slice = forecast_df.iloc[best_start_idx : best_start_idx + windows_needed]
-
-        self._log(f"Optimal start: {optimal_start.strftime('%Y-%m-%d %H:%M')}")
-        self._log(f"Optimal cost: ${best_cost:.2f}, carbon: {best_carbon:.2f}kg CO2")
 
-        if best_start_idx > 0:
-            delay_hours = (optimal_start - baseline_start).total_seconds() / 3600
-            self._log(f"Delaying workload by {delay_hours:.1f} hours for optimization")
+        if self._logging_enabled:
+            self._log(f"Optimal start: {optimal_start.strftime('%Y-%m-%d %H:%M')}")
+            self._log(f"Optimal cost: ${best_cost:.2f}, carbon: {best_carbon:.2f}kg CO2")
 
-        # Extract on-demand rate if instance was specified
-        on_demand_rate = (
-            forecast_df["on_demand_rate"].iloc[0]
-            if "on_demand_rate" in forecast_df.columns
-            else None
-        )
+            if best_start_idx > 0:
+                delay_hours = (optimal_start - baseline_start).total_seconds() / 3600
+                self._log(f"Delaying workload by {delay_hours:.1f} hours for optimization")
 
         return ScheduleResult(
             workload=workload,
@@ -307,13 +425,13 @@ class Autopilot:
             baseline_end=baseline_start + timedelta(hours=workload.duration_hours),
             optimized_cost=best_cost,
             optimized_carbon_kg=best_carbon,
-            optimized_avg_price=optimal_slice["price"].mean(),
-            optimized_avg_carbon=optimal_slice["co2_intensity"].mean(),
+            optimized_avg_price=optimal_avg_price,
+            optimized_avg_carbon=optimal_avg_carbon,
             baseline_cost=baseline_cost,
             baseline_carbon_kg=baseline_carbon,
             baseline_avg_price=baseline_avg_price,
             baseline_avg_carbon=baseline_avg_carbon,
-            on_demand_rate_per_hr=on_demand_rate,
+            on_demand_rate_per_hr=prepared.on_demand_rate,
             cost_constrained=cost_constrained,
         )
 
@@ -328,9 +446,14 @@ class Autopilot:
         Algorithm:
         1. Validates dependency graph for cycles and invalid references
         2. Sorts workloads topologically (prerequisites first)
-        3. Optimizes each workload while respecting dependency constraints
+        3. Optimizes each dependency level while respecting constraints
         4. Ensures dependent workloads start after prerequisites complete
 
+        Workloads in the same dependency level only depend on earlier levels,
+        so each level's window scans run as one batched kernel call. Workloads
+        in a level with identical shape (duration, deadline, power, priority)
+        and forecast are optimized once and share the schedule.
+
         Args:
             workloads: List of workloads (may have dependencies)
             forecast_df: Grid forecast DataFrame
@@ -360,40 +483,83 @@ class Autopilot:
 
         self._log(f"Optimizing {len(workloads)} workloads with dependencies")
 
-        schedules: list[ScheduleResult] = []
-        completed_schedules: dict[UUID, ScheduleResult] = {}
-        total_cost_savings = 0.0
-        total_carbon_savings = 0.0
-
-        # Process workloads in topological order
+        # Group workloads by dependency level (prerequisites always sit in a lower level)
+        levels: dict[int, list[UUID]] = {}
         for workload_id in execution_order:
-            workload = dep_graph.workloads[workload_id]
             level = dep_graph.get_workload_level(workload_id)
+            levels.setdefault(level, []).append(workload_id)
 
-            self._log(
-                f"Processing {workload.name} "
-                f"(level {level}, {len(workload.dependencies)} dependencies)"
-            )
+        # Dependency shifts relabel timestamps but keep the forecast values,
+        # so the forecast is converted once and shared by every workload
+        shared = self._prepare(forecast_df)
+
+        completed_schedules: dict[UUID, ScheduleResult] = {}
+
+        for level in sorted(levels):
+            level_workloads = [dep_graph.workloads[wid] for wid in levels[level]]
 
             # Apply dependency constraints to forecast
-            constrained_forecast = self._apply_dependency_constraints(
-                workload=workload,
-                forecast_df=forecast_df,
-                completed_schedules=completed_schedules,
-            )
+            constrained_forecasts = []
+            for workload in level_workloads:
+                self._log(
+                    f"Processing {workload.name} "
+                    f"(level {level}, {len(workload.dependencies)} dependencies)"
+                )
+                constrained_forecasts.append(
+                    self._apply_dependency_constraints(
+                        workload=workload,
+                        prepared=shared,
+                        completed_schedules=completed_schedules,
+                    )
+                )
 
-            # Optimize with constrained forecast
-            result = self.optimize_schedule(workload, constrained_forecast)
+            # Workloads of the same shape scheduled against the same forecast get
+            # identical schedules, so only one representative per shape is optimized
+            shape_index: dict[tuple, int] = {}
+            representatives: list[int] = []
+            shapes: list[int] = []
+            for i, (workload, constrained) in enumerate(
+                zip(level_workloads, constrained_forecasts)
+            ):
+                key = (
+                    workload.duration_hours,
+                    workload.deadline_hours,
+                    workload.power_draw_kw,
+                    workload.priority,
+                    id(constrained),
+                )
+                if key not in shape_index:
+                    shape_index[key] = len(representatives)
+                    representatives.append(i)
+                shapes.append(shape_index[key])
+
+            unique_workloads = [level_workloads[i] for i in representatives]
+            level_prepared = [constrained_forecasts[i] for i in representatives]
+            level_scans = self._scan_level(unique_workloads, level_prepared, shared)
+
+            # Optimize with constrained forecasts
+            unique_results = [
+                self._optimize_prepared(workload, prepared, scan)
+                for workload, prepared, scan in zip(unique_workloads, level_prepared, level_scans)
+            ]
 
-            # Validate constraints satisfied
-            self._validate_schedule_constraints(
-                result=result,
-                workload=workload,
-                completed_schedules=completed_schedules,
-            )
+            for workload, shape in zip(level_workloads, shapes):
+                result = unique_results[shape]
+                if result.workload is not workload:
+                    result = result.model_copy(update={"workload": workload})
 
-            schedules.append(result)
-            completed_schedules[workload_id] = result
+                # Validate constraints satisfied
+                self._validate_schedule_constraints(
+                    result=result,
+                    workload=workload,
+                    completed_schedules=completed_schedules,
+                )
+                completed_schedules[workload.id] = result
+
+        schedules = [completed_schedules[workload_id] for workload_id in execution_order]
+        total_cost_savings = 0.0
+        total_carbon_savings = 0.0
+        for result in schedules:
             total_cost_savings += result.cost_savings
             total_carbon_savings += result.carbon_savings_kg
 
@@ -405,12 +571,52 @@ class Autopilot:
             dependency_order=execution_order,
         )
 
+    def _scan_level(
+        self,
+        workloads: list[Workload],
+        level_prepared: list[_PreparedForecast],
+        shared: _PreparedForecast,
+    ) -> list[tuple[int, int]]:
+        """
+        Scan all workloads of a dependency level in one batched kernel call.
+
+        Dependency shifts only relabel timestamps, so every workload's forecast
+        shares the fleet prefix sums and only the scan bounds differ.
+
+        Args:
+            workloads: Workloads in the level
+            level_prepared: Prepared dependency-constrained forecast per workload
+            shared: Prepared fleet forecast
+
+        Returns:
+            (best_start, cheapest_start) per workload
+        """
+        bounds = np.array(
+            [
+                self._scan_bounds(workload, prepared)
+                for workload, prepared in zip(workloads, level_prepared)
+            ],
+            dtype=np.int64,
+        )
+        best_starts, cheapest_starts = best_windows(
+            shared.price_prefix,
+            shared.carbon_prefix,
+            bounds[:, 1],
+            bounds[:, 2],
+            bounds[:, 0],
+            self.config.cost_weight,
+            self.config.carbon_weight,
+            SPOT_PRICE_NORMALIZATION_CEILING,
+            CARBON_NORMALIZATION_CEILING,
+        )
+        return list(zip(best_starts.tolist(), cheapest_starts.tolist()))
+
     def _apply_dependency_constraints(
         self,
         workload: Workload,
-        forecast_df: pd.DataFrame,
+        prepared: _PreparedForecast,
         completed_schedules: dict[UUID, ScheduleResult],
-    ) -> pd.DataFrame:
+    ) -> _PreparedForecast:
         """
         Create forecast window that enforces dependency timing constraints.
 
@@ -419,20 +625,20 @@ class Autopilot:
 
         Args:
             workload: Workload to schedule
-            forecast_df: Original forecast
+            prepared: Prepared original forecast
             completed_schedules: Already-scheduled prerequisites
 
         Returns:
-            Constrained forecast DataFrame
+            Constrained prepared forecast
 
         Raises:
             ValueError: If constraints cannot be satisfied
         """
         if not workload.dependencies:
-            return forecast_df
+            return prepared
 
-        baseline_start = forecast_df.index[0]
-        earliest_start = baseline_start
+        baseline_start = prepared.index[0]
+        earliest_start: datetime = baseline_start
 
         # Calculate earliest start based on all dependencies
         for dep in workload.dependencies:
@@ -475,21 +681,12 @@ class Autopilot:
                 f"{time_shift.total_seconds() / 3600:.1f} hours"
             )
 
-            # Create shifted forecast
-            shifted_forecast = forecast_df.copy()
-            shifted_forecast.index = forecast_df.index + time_shift
-            shifted_forecast = shifted_forecast[shifted_forecast.index >= earliest_start]
-
-            if shifted_forecast.empty:
-                raise ValueError(
-                    f"Cannot schedule {workload.name}. Prerequisites complete at "
-                    f"{earliest_start}, but forecast ends at {forecast_df.index[-1]}. "
-                    f"Provide longer forecast window."
-                )
-
-            return shifted_forecast
+            # Relabel the forecast timestamps; the values and their prefix sums
+            # are unchanged. The first shifted timestamp is earliest_start
+            # itself, so no rows fall before it.
+            return replace(prepared, index=prepared.index + time_shift)
 
-        return forecast_df
+        return prepared
 
     def _validate_schedule_constraints(
         self,
@@ -540,103 +737,73 @@ class Autopilot:
         self.clear_log()
         self._log(f"Generating tradeoff frontier for: {workload.name}")
 
-        if forecast_df.empty:
-            raise ValueError("Forecast data is empty")
+        prepared = self._prepare(forecast_df)
+        windows_needed, _, max_start_idx = self._scan_bounds(workload, prepared)
 
-        # Ensure datetime index
-        if not isinstance(forecast_df.index, pd.DatetimeIndex):
-            forecast_df.index = pd.to_datetime(forecast_df.index)
-
-        # Get time resolution from forecast
-        if len(forecast_df) > 1:
-            resolution = forecast_df.index[1] - forecast_df.index[0]
-            resolution_hours = resolution.total_seconds() / 3600
-        else:
-            resolution_hours = 1.0
-
-        windows_needed = max(1, int(workload.duration_hours / resolution_hours))
-        baseline_start = forecast_df.index[0]
-        deadline = baseline_start + timedelta(hours=workload.deadline_hours)
+        prices = prepared.prices
+        carbons = prepared.carbons
 
         # Calculate baseline
-        baseline_slice = forecast_df.iloc[:windows_needed]
-        _, baseline_cost, baseline_carbon = self._calculate_window_score(baseline_slice, workload)
-
-        # Find max feasible start index
-        max_start_idx = len(forecast_df) - windows_needed
-        for idx in range(len(forecast_df)):
-            potential_end = forecast_df.index[idx] + timedelta(hours=workload.duration_hours)
-            if potential_end > deadline:
-                max_start_idx = min(max_start_idx, idx - 1)
-                break
-
-        # Pre-calculate all windows with their metrics
-        all_windows = []
-        for start_idx in range(max_start_idx + 1):
-            end_idx = start_idx + windows_needed
-            if end_idx > len(forecast_df):
-                break
-
-            window_slice = forecast_df.iloc[start_idx:end_idx]
-            _, cost, carbon = self._calculate_window_score(window_slice, workload)
-
-            all_windows.append(
-                {
-                    "start_idx": start_idx,
-                    "start_time": forecast_df.index[start_idx],
-                    "cost": cost,
-                    "carbon": carbon,
-                    "cost_savings": baseline_cost - cost,
-                    "carbon_savings": baseline_carbon - carbon,
-                    "avg_price": window_slice["price"].mean(),
-                    "avg_carbon": window_slice["co2_intensity"].mean(),
-                }
-            )
-
-        # Normalize costs and carbon for weight-blending
-        if all_windows:
-            min_cost = min(w["cost"] for w in all_windows)
-            max_cost = max(w["cost"] for w in all_windows)
-            min_carbon = min(w["carbon"] for w in all_windows)
-            max_carbon = max(w["carbon"] for w in all_windows)
-
-            cost_range = max_cost - min_cost if max_cost > min_cost else 1.0
-            carbon_range = max_carbon - min_carbon if max_carbon > min_carbon else 1.0
-
-            # Generate tradeoff points by varying weights
-            selected_points = {}  # Use dict to track unique windows by start_idx
-
-            for i in range(num_points):
-                # Weight varies from 100% cost to 0% cost (and opposite for carbon)
-                alpha = i / (num_points - 1) if num_points > 1 else 0.5
-                cost_weight = 1.0 - alpha
-                carbon_weight = alpha
-
-                # Find window with best score for this weight combination
-                best_window = None
-                best_score = float("inf")
-
-                for window in all_windows:
-                    # Normalize metrics to 0-1 range
-                    norm_cost = (window["cost"] - min_cost) / cost_range
-                    norm_carbon = (window["carbon"] - min_carbon) / carbon_range
-
-                    # Weighted score (lower is better)
-                    score = (norm_cost * cost_weight) + (norm_carbon * carbon_weight)
-
-                    if score < best_score:
-                        best_score = score
-                        best_window = window
+        _, baseline_cost, baseline_carbon, _, _ = self._window_metrics(
+            prices, carbons, 0, windows_needed, workload
+        )
 
-                if best_window:
-                    # Store by start_idx to avoid duplicates
-                    selected_points[best_window["start_idx"]] = best_window
+        if max_start_idx < 0 or num_points <= 0:
+            return []
 
-            # Convert dict to sorted list and return
-            result = sorted(selected_points.values(), key=lambda x: x["cost"])
-            return result
+        # Average every feasible window at once (same pairwise sums as a
+        # per-slice mean, so near-ties normalize exactly as before)
+        avg_prices = sliding_window_view(prices, windows_needed)[: max_start_idx + 1].mean(axis=1)
+        avg_carbons = sliding_window_view(carbons, windows_needed)[: max_start_idx + 1].mean(axis=1)
+        costs = avg_prices * workload.duration_hours
+        carbons_kg = (avg_carbons * workload.energy_kwh) / 1000
 
-        return []
+        # Normalize costs and carbon for weight-blending
+        min_cost, max_cost = costs.min(), costs.max()
+        min_carbon, max_carbon = carbons_kg.min(), carbons_kg.max()
+
+        cost_range = max_cost - min_cost if max_cost > min_cost else 1.0
+        carbon_range = max_carbon - min_carbon if max_carbon > min_carbon else 1.0
+
+        norm_costs = (costs - min_cost) / cost_range
+        norm_carbons = (carbons_kg - min_carbon) / carbon_range
+
+        # Weight varies from 100% cost to 0% cost (and opposite for carbon).
+        # Score every window under every weight blend at once (one row per
+        # blend, lower is better); argmin takes each row's earliest best window
+        if num_points > 1:
+            # The end blends are pure cost and pure carbon, so only the
+            # interior blends need scoring
+            alphas = np.arange(1, num_points - 1) / (num_points - 1)
+            scores = np.outer(1.0 - alphas, norm_costs) + np.outer(alphas, norm_carbons)
+            winners = dict.fromkeys(
+                [
+                    int(norm_costs.argmin()),
+                    *scores.argmin(axis=1).tolist(),
+                    int(norm_carbons.argmin()),
+                ]
+            )
+        else:
+            alphas = np.full(num_points, 0.5)
+            scores = np.outer(1.0 - alphas, norm_costs) + np.outer(alphas, norm_carbons)
+            winners = dict.fromkeys(scores.argmin(axis=1).tolist())
+
+        # Build tradeoff points for the distinct winning windows only
+        selected_points = [
+            {
+                "start_idx": start_idx,
+                "start_time": prepared.index[start_idx],
+                "cost": costs[start_idx],
+                "carbon": carbons_kg[start_idx],
+                "cost_savings": baseline_cost - costs[start_idx],
+                "carbon_savings": baseline_carbon - carbons_kg[start_idx],
+                "avg_price": avg_prices[start_idx],
+                "avg_carbon": avg_carbons[start_idx],
+            }
+            for start_idx in winners
+        ]
+
+        return sorted(selected_points, key=lambda x: x["cost"])
 
     def compare_regions(
         self,
@@ -6,9 +6,18 @@ Provides sensible defaults for all settings.
 """
 
 from pathlib import Path
+from typing import Any
 
 import yaml
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, Field, model_validator
+
+# Prefer the LibYAML bindings when PyYAML was built with them
+try:
+    from yaml import CSafeDumper as _SafeDumper
+    from yaml import CSafeLoader as _SafeLoader
+except ImportError:
+    from yaml import SafeDumper as _SafeDumper
+    from yaml import SafeLoader as _SafeLoader
 
 
 class OptimizationSettings(BaseModel):
@@ -25,18 +34,12 @@ class OptimizationSettings(BaseModel):
     )
     prefer_continuous: bool = Field(default=True, description="Prefer continuous execution windows")
 
-    @field_validator("cost_weight", "carbon_weight")
-    @classmethod
-    def validate_weights(cls, v, info):
+    @model_validator(mode="after")
+    def validate_weights(self) -> "OptimizationSettings":
         """Ensure weights sum to 1.0."""
-        if info.field_name == "carbon_weight":
-            # Only validate when both fields are present
-            data = info.data
-            if "cost_weight" in data:
-                cost_weight = data["cost_weight"]
-                if abs(cost_weight + v - 1.0) > 0.01:
-                    raise ValueError("cost_weight and carbon_weight must sum to 1.0")
-        return v
+        if abs(self.cost_weight + self.carbon_weight - 1.0) > 0.01:
+            raise ValueError("cost_weight and carbon_weight must sum to 1.0")
+        return self
 
 
 class DefaultWorkloadSettings(BaseModel):
@@ -155,8 +158,7 @@ class ArboricConfig(BaseModel):
 
         # Load and parse YAML
         try:
-            with open(config_path) as f:
-                config_data = yaml.safe_load(f) or {}
+            config_data = _read_config_data(config_path)
 
             # Handle empty file
             if not config_data:
@@ -185,7 +187,14 @@ class ArboricConfig(BaseModel):
         config_dict = self.model_dump(exclude_none=True)
 
         with open(config_path, "w") as f:
-            yaml.safe_dump(config_dict, f, default_flow_style=False, sort_keys=False, indent=2)
+            yaml.dump(
+                config_dict,
+                f,
+                Dumper=_SafeDumper,
+                default_flow_style=False,
+                sort_keys=False,
+                indent=2,
+            )
 
     @classmethod
     def create_default_config(cls, config_path: Path | None = None) -> "ArboricConfig":
@@ -211,6 +220,31 @@ class ArboricConfig(BaseModel):
         return config
 
 
+# Last parsed config file, keyed by (path, mtime, size); see _read_config_data
+_config_data_cache: dict[tuple[Path, int, int], dict[str, Any]] = {}
+
+
+def _read_config_data(config_path: Path) -> dict[str, Any]:
+    """
+    Parse a YAML config file, reusing the last parse while it is unchanged.
+
+    Only the parsed data is cached; callers build a fresh ArboricConfig from
+    it, so mutating a loaded config never leaks into later loads.
+
+    Raises:
+        OSError: If the file cannot be read
+        yaml.YAMLError: If the file is not valid YAML
+    """
+    stat = config_path.stat()
+    key = (config_path, stat.st_mtime_ns, stat.st_size)
+    if key not in _config_data_cache:
+        with open(config_path) as f:
+            data = yaml.load(f, Loader=_SafeLoader) or {}
+        _config_data_cache.clear()
+        _config_data_cache[key] = data
+    return _config_data_cache[key]
+
+
 # Global config instance (lazy loaded)
 _config: ArboricConfig | None = None
 
@@ -237,3 +271,4 @@ def reset_config() -> None:
     """Reset the global config (mainly for testing)."""
     global _config
     _config = None
+    _config_data_cache.clear()
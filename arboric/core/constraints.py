@@ -5,6 +5,7 @@ Dependency graph analysis, validation, and topological sorting
 for multi-workload scheduling with constraints.
 """
 
+from collections import deque
 from uuid import UUID
 
 from arboric.core.models import Workload
@@ -33,8 +34,7 @@ class DependencyGraph:
     Manages and validates workload dependency relationships.
 
     Provides:
-    - Circular dependency detection (DFS-based)
-    - Topological sorting (Kahn's algorithm)
+    - Topological sorting with circular dependency detection (Kahn's algorithm)
     - Dependency chain analysis
     - Graph structure validation
     """
@@ -55,7 +55,7 @@ class DependencyGraph:
         self.reverse_adjacency: dict[UUID, list[UUID]] = {}
 
         self._build_graph()
-        self._validate_graph()
+        self._sorted_order = self._sort_graph()
 
     def _build_graph(self) -> None:
         """Build adjacency list representation of dependency graph."""
@@ -84,43 +84,18 @@ class DependencyGraph:
                 # reverse: prerequisite -> workloads that depend on it
                 self.reverse_adjacency[prereq_id].append(workload.id)
 
-    def _validate_graph(self) -> None:
-        """Detect circular dependencies using DFS."""
-        visited: set[UUID] = set()
-        rec_stack: set[UUID] = set()
-
-        def has_cycle(node: UUID) -> bool:
-            visited.add(node)
-            rec_stack.add(node)
-
-            for prereq in self.adjacency_list[node]:
-                if prereq not in visited:
-                    if has_cycle(prereq):
-                        return True
-                elif prereq in rec_stack:
-                    # Back edge detected - cycle exists
-                    return True
-
-            rec_stack.remove(node)
-            return False
-
-        for wid in self.workloads:
-            if wid not in visited:
-                if has_cycle(wid):
-                    raise CircularDependencyError(
-                        "Circular dependency detected. All workloads must "
-                        "form a directed acyclic graph (DAG)."
-                    )
-
-    def topological_sort(self) -> list[UUID]:
+    def _sort_graph(self) -> list[UUID]:
         """
-        Return workload IDs in topologically sorted order.
+        Order workloads with Kahn's algorithm (BFS-based topological sort).
 
-        Uses Kahn's algorithm (BFS-based topological sort).
-        Workloads with no dependencies come first.
+        Any workload left unprocessed sits on a cycle, so this pass doubles
+        as the graph's cycle check.
 
         Returns:
             List of workload IDs in execution order
+
+        Raises:
+            CircularDependencyError: If circular dependencies exist
         """
         # Calculate in-degrees (number of prerequisites)
         in_degree: dict[UUID, int] = {
@@ -128,11 +103,11 @@ class DependencyGraph:
         }
 
         # Start with workloads that have no dependencies
-        queue: list[UUID] = [wid for wid, deg in in_degree.items() if deg == 0]
+        queue: deque[UUID] = deque(wid for wid, deg in in_degree.items() if deg == 0)
         sorted_order: list[UUID] = []
 
         while queue:
-            current = queue.pop(0)
+            current = queue.popleft()
             sorted_order.append(current)
 
             # Reduce in-degree for dependent workloads
@@ -143,10 +118,25 @@ class DependencyGraph:
 
         # If not all workloads processed, cycle exists
         if len(sorted_order) != len(self.workloads):
-            raise CircularDependencyError("Failed to produce topological sort - cycle detected")
+            raise CircularDependencyError(
+                "Circular dependency detected. All workloads must "
+                "form a directed acyclic graph (DAG)."
+            )
 
         return sorted_order
 
+    def topological_sort(self) -> list[UUID]:
+        """
+        Return workload IDs in topologically sorted order.
+
+        The order is computed once when the graph is built (see _sort_graph).
+        Workloads with no dependencies come first.
+
+        Returns:
+            List of workload IDs in execution order
+        """
+        return list(self._sorted_order)
+
     def get_workload_level(self, workload_id: UUID) -> int:
         """
         Get dependency level of a workload.
@@ -16,11 +16,15 @@ This package provides MockGrid simulation; live integrations are available separ
 import math
 import random
 from datetime import datetime, timedelta
-
-import pandas as pd
+from typing import TYPE_CHECKING
 
 from arboric.core.models import GridWindow
 
+if TYPE_CHECKING:
+    import pandas as pd
+
+    from arboric.core.config import ArboricConfig
+
 # Regional profiles (carbon patterns + cloud spot pricing)
 # Carbon fields: model electricity grid generation mix (solar duck curve, evening peaker ramps)
 # Pricing fields: model cloud spot instance rates (business-hours capacity contention)
@@ -261,6 +265,9 @@ class MockGrid:
             )
 
         self.profile = REGION_PROFILES[self.region]
+        self.instance_type = instance_type
+        self.cloud_provider = cloud_provider
+        self.seed = seed
 
         # Resolve instance profile
         if cloud_provider and instance_type:
@@ -417,7 +424,7 @@ class MockGrid:
 
     def get_forecast(
         self, hours: int = 24, resolution_minutes: int = 60, start_time: datetime | None = None
-    ) -> pd.DataFrame:
+    ) -> "pd.DataFrame":
         """
         Generate a grid forecast for the specified time horizon.
 
@@ -469,7 +476,10 @@ class MockGrid:
             )
             windows.append(window)
 
-        # Convert to DataFrame
+        # Convert to DataFrame (pandas is imported here so that loading the
+        # grid profiles, e.g. for `arboric status`, stays cheap)
+        import pandas as pd
+
         df = pd.DataFrame([w.model_dump() for w in windows])
         df["timestamp"] = pd.to_datetime(df["timestamp"])
         df = df.set_index("timestamp")
@@ -494,7 +504,7 @@ class MockGrid:
             confidence=1.0,
         )
 
-    def detect_events(self, forecast_df: pd.DataFrame) -> list[dict]:
+    def detect_events(self, forecast_df: "pd.DataFrame") -> list[dict]:
         """
         Detect notable grid events in the forecast.
 
@@ -561,6 +571,19 @@ class MockGrid:
         return events
 
 
+def daily_seed() -> int:
+    """Date-based MockGrid seed (YYYYMMDD): same day, same forecast."""
+    from datetime import datetime as dt
+
+    return int(dt.now().strftime("%Y%m%d"))
+
+
+def uses_live_grid(config: "ArboricConfig") -> bool:
+    """Whether get_grid will attempt a LiveGrid for this configuration."""
+    live_data = config.live_data
+    return bool(live_data.enabled and live_data.api_key and live_data.api_secret)
+
+
 def get_grid(
     region: str = "eastus",
     config=None,
@@ -596,7 +619,7 @@ def get_grid(
     live_data = config.live_data
 
     # Only attempt LiveGrid if live mode is enabled and arboric-cloud is available
-    if live_data.enabled and live_data.api_key and live_data.api_secret:
+    if uses_live_grid(config):
         try:
             # Try to import from the optional arboric-cloud package
             from arboric_cloud import create_live_grid
@@ -626,9 +649,7 @@ def get_grid(
     # Default: return MockGrid simulation
     # Use date-based seed for reproducibility (same day = same forecast)
     if seed is None:
-        from datetime import datetime as dt
-
-        seed = int(dt.now().strftime("%Y%m%d"))
+        seed = daily_seed()
     return MockGrid(
         region=region,
         instance_type=instance_type,
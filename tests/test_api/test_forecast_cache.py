@@ -0,0 +1,101 @@
+"""
+Tests for the API forecast cache.
+"""
+
+import pytest
+
+from arboric.api import cache
+from arboric.api.cache import (
+    clear_forecast_cache,
+    forecast_to_records,
+    get_forecast,
+    get_forecast_records,
+    get_shared_grid,
+    warm_forecast_cache,
+)
+from arboric.core.config import ArboricConfig
+from arboric.core.grid_oracle import MockGrid
+
+
+@pytest.fixture(autouse=True)
+def _clear_cache():
+    """Start each test with an empty cache."""
+    clear_forecast_cache()
+    yield
+    clear_forecast_cache()
+
+
+def test_cached_forecast_matches_fresh_grid():
+    """Cached forecast is identical to a freshly generated one."""
+    cached = get_forecast(MockGrid(region="eastus", seed=7), 24)
+    fresh = get_forecast(MockGrid(region="eastus", seed=7), 24)
+
+    assert cached.equals(fresh)
+    assert len(cached) == 24
+
+
+def test_cached_forecast_returns_private_copy():
+    """Mutating a returned forecast does not leak into the cache."""
+    first = get_forecast(MockGrid(region="eastus", seed=7), 24)
+    first["price"] = 0.0
+
+    second = get_forecast(MockGrid(region="eastus", seed=7), 24)
+    assert (second["price"] > 0).all()
+
+
+def test_cache_key_includes_region_and_seed():
+    """Different regions or seeds produce different forecasts."""
+    base = get_forecast(MockGrid(region="eastus", seed=7), 24)
+    other_region = get_forecast(MockGrid(region="westus2", seed=7), 24)
+    other_seed = get_forecast(MockGrid(region="eastus", seed=8), 24)
+
+    assert not base.equals(other_region)
+    assert not base.equals(other_seed)
+
+
+def test_unseeded_grid_bypasses_cache():
+    """Unseeded grids are not reproducible and must not be cached."""
+    forecast = get_forecast(MockGrid(region="eastus"), 12)
+    assert len(forecast) == 12
+
+
+def test_forecast_records_shape():
+    """Records include the timestamp alongside every forecast column."""
+    records = get_forecast_records(MockGrid(region="uksouth", seed=7), 6)
+
+    assert len(records) == 6
+    assert {"timestamp", "price", "co2_intensity", "renewable_percentage"} <= records[0].keys()
+
+
+def test_forecast_to_records_matches_pandas():
+    """Column-wise conversion matches pandas' records output."""
+    forecast_df = MockGrid(region="westus2", seed=3).get_forecast(hours=12)
+
+    expected = forecast_df.reset_index().to_dict(orient="records")
+    assert forecast_to_records(forecast_df) == expected
+
+
+def test_shared_grid_reused_per_region():
+    """Simulated grids are built once per region and instance profile."""
+    config = ArboricConfig()
+    grid = get_shared_grid("EastUS", config)
+
+    assert get_shared_grid("eastus", config) is grid
+    assert get_shared_grid("westus2", config) is not grid
+    assert get_shared_grid("eastus", config, "p3.8xlarge", "aws") is not grid
+
+
+def test_shared_grid_rejects_unknown_region():
+    """Unknown regions still raise ValueError (mapped to HTTP 400)."""
+    with pytest.raises(ValueError, match="Unknown region"):
+        get_shared_grid("mars", ArboricConfig())
+
+
+def test_warm_forecast_cache_fills_every_region():
+    """Warm-up builds 24h and 48h forecasts for all simulated regions."""
+    warm_forecast_cache(ArboricConfig())
+
+    info = cache._cached_mock_forecast_records.cache_info()
+    assert info.currsize == 8
+    get_forecast_records(get_shared_grid("eastus", ArboricConfig()), 48)
+    assert cache._cached_mock_forecast_records.cache_info().hits == info.hits + 1
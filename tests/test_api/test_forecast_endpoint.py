@@ -85,3 +85,42 @@ def test_forecast_all_supported_regions(client):
 
         data = response.json()
         assert data["data"]["metadata"]["region"] == region
+
+
+def test_forecast_streams_full_week(client):
+    """Test that a week-long streamed forecast is one valid JSON document."""
+    response = client.get("/api/v1/forecast?hours=168")
+
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/json"
+    data = response.json()
+
+    assert data["command"] == "forecast"
+    assert data["data"]["metadata"]["data_points"] == 168
+    timestamps = [row["timestamp"] for row in data["data"]["data"]]
+    assert len(timestamps) == 168
+    assert timestamps == sorted(timestamps)
+
+
+def test_forecast_etag_not_modified(client):
+    """Test that a matching If-None-Match returns 304 with no body."""
+    response = client.get("/api/v1/forecast?hours=12")
+
+    etag = response.headers["etag"]
+    assert response.headers["cache-control"].startswith("public, max-age=")
+
+    cached = client.get("/api/v1/forecast?hours=12", headers={"If-None-Match": etag})
+    assert cached.status_code == 304
+    assert cached.content == b""
+
+    other = client.get("/api/v1/forecast?hours=24", headers={"If-None-Match": etag})
+    assert other.status_code == 200
+
+
+def test_forecast_response_is_gzipped(client):
+    """Test that large forecast responses are gzip-compressed on request."""
+    response = client.get("/api/v1/forecast?hours=168", headers={"Accept-Encoding": "gzip"})
+
+    assert response.status_code == 200
+    assert response.headers["content-encoding"] == "gzip"
+    assert len(response.json()["data"]["data"]) == 168
@@ -77,3 +77,39 @@ def test_config_endpoint(client):
     assert "cost_weight" in optimization
     assert "carbon_weight" in optimization
     assert optimization["cost_weight"] + optimization["carbon_weight"] == 1.0
+
+
+def test_config_endpoint_etag(client):
+    """Test config endpoint honours If-None-Match."""
+    response = client.get("/api/v1/config")
+    etag = response.headers["etag"]
+
+    cached = client.get("/api/v1/config", headers={"If-None-Match": etag})
+    assert cached.status_code == 304
+    assert cached.headers["etag"] == etag
+
+    stale = client.get("/api/v1/config", headers={"If-None-Match": 'W/"stale"'})
+    assert stale.status_code == 200
+
+
+def test_config_endpoint_reflects_reload(client):
+    """Cached config payload is rebuilt when the config object changes."""
+    from arboric.api.dependencies import get_arboric_config
+    from arboric.api.main import app
+    from arboric.core.config import ArboricConfig, OptimizationSettings
+
+    reloaded = ArboricConfig(
+        optimization=OptimizationSettings(cost_weight=0.4, carbon_weight=0.6),
+    )
+
+    client.get("/api/v1/config")
+    app.dependency_overrides[get_arboric_config] = lambda: reloaded
+    try:
+        response = client.get("/api/v1/config")
+        status_response = client.get("/api/v1/status")
+    finally:
+        app.dependency_overrides.pop(get_arboric_config, None)
+
+    assert response.json()["data"]["optimization"]["cost_weight"] == 0.4
+    configuration = status_response.json()["data"]["configuration"]
+    assert configuration["default_cost_weight"] == 0.4
@@ -124,3 +124,17 @@ def test_optimize_with_invalid_optimization_config(client):
     assert response.status_code == 422
     error = response.json()
     assert "ValidationError" in error["error"] or "weight" in str(error).lower()
+
+
+def test_optimize_reuses_schedule_for_same_shape(client, sample_workload_payload):
+    """Repeat requests for the same workload shape reuse the schedule."""
+    first = client.post("/api/v1/optimize", json=sample_workload_payload).json()["data"]
+
+    renamed = {**sample_workload_payload}
+    renamed["workload"] = {**sample_workload_payload["workload"], "name": "Renamed Job"}
+    second = client.post("/api/v1/optimize", json=renamed).json()["data"]
+
+    assert second["workload"]["name"] == "Renamed Job"
+    assert second["workload"]["id"] != first["workload"]["id"]
+    assert second["optimization"] == first["optimization"]
+    assert second["metrics"] == first["metrics"]
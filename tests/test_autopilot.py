@@ -130,6 +130,82 @@ class TestAutopilot:
         assert result.cost_savings > 0
         assert result.optimized_cost < result.baseline_cost
 
+    def test_tied_windows_prefer_earliest_start(self):
+        """Test that equally good windows resolve to the earliest start."""
+        now = datetime.now().replace(minute=0, second=0, microsecond=0)
+        data = {
+            "timestamp": [now + timedelta(hours=i) for i in range(24)],
+            "co2_intensity": [300.0] * 24,
+            "price": [0.20 if i < 6 else 0.08 for i in range(24)],
+            "renewable_percentage": [50.0] * 24,
+            "region": ["eastus"] * 24,
+            "confidence": [1.0] * 24,
+        }
+        forecast = pd.DataFrame(data).set_index("timestamp")
+
+        workload = Workload(
+            name="Tie Test",
+            duration_hours=3.0,
+            power_draw_kw=100.0,
+            deadline_hours=18.0,
+        )
+
+        result = Autopilot().optimize_schedule(workload, forecast)
+
+        assert result.optimal_start == now + timedelta(hours=6)
+
+    def test_baseline_at_lower_bound_skips_scan(self):
+        """Test that a baseline already at the cheapest and cleanest slots is kept."""
+        now = datetime.now().replace(minute=0, second=0, microsecond=0)
+        data = {
+            "timestamp": [now + timedelta(hours=i) for i in range(24)],
+            "co2_intensity": [200.0 + i * 10 for i in range(24)],
+            "price": [0.05 + i * 0.01 for i in range(24)],
+            "renewable_percentage": [50.0] * 24,
+            "region": ["eastus"] * 24,
+            "confidence": [1.0] * 24,
+        }
+        forecast = pd.DataFrame(data).set_index("timestamp")
+
+        workload = Workload(
+            name="Rising Prices",
+            duration_hours=1.0,
+            power_draw_kw=100.0,
+            deadline_hours=18.0,
+        )
+
+        autopilot = Autopilot()
+        result = autopilot.optimize_schedule(workload, forecast)
+
+        assert result.optimal_start == now
+        assert any("skipping scan" in msg for msg in autopilot.get_log())
+
+    def test_single_feasible_window_skips_scan(self):
+        """Test that a workload filling its whole deadline keeps the only start."""
+        now = datetime.now().replace(minute=0, second=0, microsecond=0)
+        data = {
+            "timestamp": [now + timedelta(hours=i) for i in range(24)],
+            "co2_intensity": [400.0 - i * 10 for i in range(24)],
+            "price": [0.20 - i * 0.005 for i in range(24)],
+            "renewable_percentage": [50.0] * 24,
+            "region": ["eastus"] * 24,
+            "confidence": [1.0] * 24,
+        }
+        forecast = pd.DataFrame(data).set_index("timestamp")
+
+        workload = Workload(
+            name="Fills Deadline",
+            duration_hours=6.0,
+            power_draw_kw=100.0,
+            deadline_hours=6.0,
+        )
+
+        autopilot = Autopilot()
+        result = autopilot.optimize_schedule(workload, forecast)
+
+        assert result.optimal_start == now
+        assert any("one feasible start" in msg for msg in autopilot.get_log())
+
     def test_optimize_schedule_finds_greener_window(self):
         """Test that optimization considers carbon intensity."""
         # Create a forecast with clear carbon variation
@@ -231,6 +307,23 @@ class TestAutopilot:
         # Carbon savings may be negative when cost weight (70%) dominates optimization
         assert isinstance(fleet_result.total_carbon_savings_kg, float)
 
+    def test_optimize_fleet_identical_workloads_share_schedule(self):
+        """Identical workloads get the schedule a single optimization would."""
+        grid = MockGrid(region="eastus", seed=42)
+        forecast = grid.get_forecast(hours=24)
+
+        workloads = [
+            Workload(name=f"ETL {i}", duration_hours=2.0, power_draw_kw=30.0, deadline_hours=12.0)
+            for i in range(4)
+        ]
+
+        fleet_result = Autopilot().optimize_fleet(workloads, forecast)
+        single = Autopilot().optimize_schedule(workloads[0], forecast)
+
+        assert [s.workload for s in fleet_result.schedules] == workloads
+        assert {s.optimal_start for s in fleet_result.schedules} == {single.optimal_start}
+        assert fleet_result.total_cost_savings == pytest.approx(4 * single.cost_savings)
+
     def test_empty_forecast_raises_error(self, simple_workload):
         """Test that empty forecast raises an error."""
         autopilot = Autopilot()
@@ -258,6 +351,16 @@ class TestAutopilot:
         autopilot.clear_log()
         assert len(autopilot.get_log()) == 0
 
+    def test_log_disabled(self, simple_workload, simple_forecast):
+        """Test that disabling the log records nothing but still optimizes."""
+        autopilot = Autopilot(enable_log=False)
+        result = autopilot.optimize_schedule(simple_workload, simple_forecast)
+
+        assert autopilot.get_log() == []
+        assert result.optimal_start == (
+            Autopilot().optimize_schedule(simple_workload, simple_forecast).optimal_start
+        )
+
     def test_realistic_scenario_with_mock_grid(self):
         """Test a realistic optimization scenario using MockGrid."""
         grid = MockGrid(region="eastus", seed=123)
@@ -296,3 +399,10 @@ class TestAutopilot:
             + min(result.optimized_avg_carbon / 600, 1.0) * 100 * 0.3
         )
         assert optimized_score <= baseline_score
+
+    def test_tradeoff_frontier_without_points_is_empty(self, simple_workload, simple_forecast):
+        """A frontier asked for no points returns no points."""
+        autopilot = Autopilot()
+
+        assert autopilot.generate_tradeoff_frontier(simple_workload, simple_forecast, 0) == []
+        assert autopilot.generate_tradeoff_frontier(simple_workload, simple_forecast, -3) == []
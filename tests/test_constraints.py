@@ -241,6 +241,27 @@ class TestDependencyGraph:
         with pytest.raises(CircularDependencyError, match="Circular dependency"):
             DependencyGraph([a, b, c])
 
+    def test_deep_chain_does_not_recurse(self):
+        """A chain deeper than the recursion limit validates and sorts."""
+        chain = [
+            Workload(name="Job 0", duration_hours=1.0, power_draw_kw=10.0, deadline_hours=12.0)
+        ]
+        for i in range(1, 2000):
+            chain.append(
+                Workload(
+                    name=f"Job {i}",
+                    duration_hours=1.0,
+                    power_draw_kw=10.0,
+                    deadline_hours=12.0,
+                    dependencies=[WorkloadDependency(source_workload_id=chain[-1].id)],
+                )
+            )
+
+        # Listing the last job first checks the order follows the dependencies
+        graph = DependencyGraph(chain[::-1])
+
+        assert graph.topological_sort() == [w.id for w in chain]
+
     def test_invalid_dependency_reference(self):
         """Dependency on non-existent workload raises error."""
         nonexistent_id = UUID("ffffffff-ffff-ffff-ffff-ffffffffffff")
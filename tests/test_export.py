@@ -175,6 +175,16 @@ class TestScheduleResultExport:
         assert data["command"] == "optimize"
         assert data["data"]["workload"]["name"] == "Test Job"
 
+    def test_export_json_is_utf8(self, sample_schedule_result, tmp_path):
+        """Test non-ASCII workload names are written as UTF-8."""
+        workload = sample_schedule_result.workload.model_copy(update={"name": "Modèle 训练"})
+        result = sample_schedule_result.model_copy(update={"workload": workload})
+        output_file = tmp_path / "result.json"
+        export_schedule_result(result, output_file, ExportFormat.JSON)
+
+        data = json.loads(output_file.read_bytes().decode("utf-8"))
+        assert data["data"]["workload"]["name"] == "Modèle 训练"
+
 
 class TestFleetResultExport:
     """Test FleetOptimizationResult export functionality."""
@@ -266,6 +276,29 @@ class TestFleetResultExport:
             assert rows[i]["record_type"] == "detail"
             assert rows[i]["workload_name"] == f"Job {i}"
 
+    def test_export_fleet_csv_rows_share_timestamp(self, sample_fleet_result, tmp_path):
+        """Test every fleet CSV row carries the same export timestamp."""
+        output_file = tmp_path / "fleet.csv"
+        export_fleet_result(sample_fleet_result, output_file, ExportFormat.CSV)
+
+        with open(output_file) as f:
+            rows = list(csv.DictReader(f))
+
+        assert len({row["timestamp"] for row in rows}) == 1
+
+    def test_export_fleet_csv_columns_aligned(self, sample_fleet_result, tmp_path):
+        """Test summary and detail rows line up with the header."""
+        output_file = tmp_path / "fleet.csv"
+        export_fleet_result(sample_fleet_result, output_file, ExportFormat.CSV)
+
+        with open(output_file) as f:
+            header, summary, *details = list(csv.reader(f))
+
+        assert {len(summary), *(len(row) for row in details)} == {len(header)}
+        assert dict(zip(header, summary))["workload_name"] == ""
+        assert dict(zip(header, details[0]))["fleet_total_workloads"] == ""
+        assert dict(zip(header, details[0]))["workload_name"] == "Job 1"
+
 
 class TestForecastExport:
     """Test forecast export functionality."""
@@ -321,6 +354,15 @@ class TestForecastExport:
         assert "price" in df.columns
         assert "renewable_percentage" in df.columns
 
+    def test_export_forecast_csv_quotes_when_needed(self, sample_forecast, tmp_path):
+        """Test cells with delimiters are still quoted in forecast CSV."""
+        sample_forecast["region"] = 'east, "us"'
+        output_file = tmp_path / "forecast.csv"
+        export_forecast(sample_forecast, "eastus", 24, output_file, ExportFormat.CSV)
+
+        df = pd.read_csv(output_file, index_col=0)
+        assert (df["region"] == 'east, "us"').all()
+
 
 class TestErrorHandling:
     """Test error handling in export functions."""
@@ -370,3 +412,14 @@ class TestErrorHandling:
 
         with pytest.raises(ExportError, match="Permission denied"):
             export_schedule_result(sample_result, output_file, ExportFormat.JSON)
+
+    def test_removed_directory_recreated(self, sample_result, tmp_path):
+        """Test a directory removed between exports is created again."""
+        output_dir = tmp_path / "exports"
+        export_schedule_result(sample_result, output_dir / "a.json", ExportFormat.JSON)
+
+        (output_dir / "a.json").unlink()
+        output_dir.rmdir()
+
+        export_schedule_result(sample_result, output_dir / "b.json", ExportFormat.JSON)
+        assert (output_dir / "b.json").exists()
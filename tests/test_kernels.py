@@ -0,0 +1,37 @@
+"""
+Tests for the Autopilot window-scan kernels.
+"""
+
+import numpy as np
+import pytest
+
+from arboric.core._kernels import _best_window_loop, _best_window_numpy, prefix_sums
+
+
+@pytest.mark.parametrize("windows_needed", [1, 3, 8])
+def test_loop_and_array_scans_agree(windows_needed):
+    """The numba loop form picks the same windows as the array form."""
+    rng = np.random.default_rng(7)
+    prices = np.round(rng.uniform(5.0, 30.0, 96), 1)  # rounding creates exact ties
+    carbons = rng.uniform(80.0, 700.0, 96)
+    price_prefix, carbon_prefix = prefix_sums(prices), prefix_sums(carbons)
+
+    for first_start, last_start in [(0, 96 - windows_needed), (4, 40), (10, 10), (5, 4)]:
+        args = (
+            price_prefix,
+            carbon_prefix,
+            first_start,
+            last_start,
+            windows_needed,
+            0.7,
+            0.3,
+            35.0,
+            600.0,
+        )
+        assert _best_window_loop(*args) == _best_window_numpy(*args)
+
+
+def test_empty_range_returns_no_window():
+    """An empty feasible range yields -1 for both starts."""
+    prefix = prefix_sums(np.ones(4))
+    assert _best_window_loop(prefix, prefix, 3, 2, 1, 0.7, 0.3, 35.0, 600.0) == (-1, -1)